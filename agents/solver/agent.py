@@ -46,9 +46,11 @@ from tools.wrappers import (
     # Wiki
     rename_wiki,
     create_wiki_pages,
+    invalidate_wiki_paths,
     # Current employee
     get_current_employee,
 )
+from tools.employee import invalidate_project
 from infra import write_json_event, finalize_task
 from infra.agent_log import write_entry
 from agents.common import TaskContext, RoleResult
@@ -356,6 +358,7 @@ The entity extractor could not find database matches for the following terms:
                     content=job.function.content,
                     changed_by=job.function.changed_by,
                 ))
+                invalidate_wiki_paths()
             elif isinstance(job.function, Rename_Wiki):
                 result = rename_wiki(store_api, job.function)
             elif isinstance(job.function, Create_Wiki_Pages):
@@ -428,12 +431,14 @@ The entity extractor could not find database matches for the following terms:
                     team=job.function.team,
                     changed_by=job.function.changed_by,
                 ))
+                invalidate_project(job.function.project_id)
             elif isinstance(job.function, Change_Project_Status):
                 result = store_api.dispatch(dev.Req_UpdateProjectStatus(
                     id=job.function.project_id,
                     status=job.function.status,
                     changed_by=job.function.changed_by,
                 ))
+                invalidate_project(job.function.project_id)
             elif isinstance(job.function, Update_EmployeeInfo):
                 # PATCH-style update: wrapper fetches current data and merges
                 result = update_employee_info(store_api, job.function)
@@ -24,6 +24,9 @@ class AgentConfig(BaseModel):
 
     task_timeout_sec: int = 300
 
+    # Page limit for list/search requests; 0 = discover it per request type (binary search)
+    page_limit: int = 0
+
     # Data dump: download API data before each task (can take a while). logs/sessions/<sess_id>/<task_spec>/api_data
     data_dump: bool = False
 
@@ -14,6 +14,7 @@ from .core import (
     # Error handling
     TaskTerminated,
     handle_api_error,
+    reset_terminated_tasks,
     # Utilities
     filter_none,
     make_resolved_key,
@@ -40,6 +41,7 @@ __all__ = [
     "INDEX_ROOT",
     "TaskTerminated",
     "handle_api_error",
+    "reset_terminated_tasks",
     "filter_none",
     "make_resolved_key",
     # LLM
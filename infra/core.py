@@ -1,6 +1,7 @@
 """Common utilities shared across agents"""
 
 import json
+import threading
 import time
 from pathlib import Path
 from typing import Any, List, Optional, Tuple
@@ -201,6 +202,37 @@ class TaskTerminated(Exception):
         super().__init__(f"Task terminated: {method} returned {status}: {error}")
 
 
+# task_id -> (method, status, error, score, eval_logs, task_completed) of the
+# TaskTerminated already raised for that task. Reset at task start.
+_terminated_tasks = {}
+# task_id -> lock serializing handle_api_error within one task
+_task_error_locks = {}
+_task_error_locks_guard = threading.Lock()
+
+
+def reset_terminated_tasks() -> None:
+    """Forget terminated tasks and their error locks (call at task start)."""
+    with _task_error_locks_guard:
+        _terminated_tasks.clear()
+        _task_error_locks.clear()
+
+
+def _task_error_lock(task_id: Any) -> threading.Lock:
+    """Lock for handle_api_error calls of one task (None = calls without a task)."""
+    with _task_error_locks_guard:
+        return _task_error_locks.setdefault(task_id, threading.Lock())
+
+
+def _task_terminated(method: str, status: int, error: str, score: Any, eval_logs: Any,
+                     task_completed: bool) -> TaskTerminated:
+    """TaskTerminated with score info attached."""
+    exc = TaskTerminated(method, status, error)
+    exc.score = score
+    exc.eval_logs = eval_logs
+    exc.task_completed = task_completed
+    return exc
+
+
 def handle_api_error(
     e: Exception,
     method: str,
@@ -246,69 +278,76 @@ def handle_api_error(
     if status == 404:
         return
 
-    # Log error
-    write_json_event(log_file, {
-        "role": "system",
-        "type": "api_error",
-        "status": status,
-        "method": method,
-        "error": error_msg,
-    })
+    # Tools may call the API from worker threads: handle one error of a task
+    # at a time and respond/complete each task only once
+    task_id = getattr(task, "task_id", None)
+    with _task_error_lock(task_id):
+        terminated = _terminated_tasks.get(task_id) if task_id is not None else None
+        if terminated is not None:
+            raise _task_terminated(*terminated)
+
+        # Log error
+        write_json_event(log_file, {
+            "role": "system",
+            "type": "api_error",
+            "status": status,
+            "method": method,
+            "error": error_msg,
+        })
 
-    # NOTE: Telemetry (token logging) is NOT sent here.
-    # Caller must call _finalize_task() which handles all telemetry centrally.
+        # NOTE: Telemetry (token logging) is NOT sent here.
+        # Caller must call _finalize_task() which handles all telemetry centrally.
 
-    # Prepare response
-    outcome = "error_internal"
-    message = f"Server error in {method}: {error_msg}"
+        # Prepare response
+        outcome = "error_internal"
+        message = f"Server error in {method}: {error_msg}"
 
-    # Print response being sent
-    print(f"{CLI_RED}[server_error]{CLI_CLR} Sending response: outcome={outcome}, message={message}")
+        # Print response being sent
+        print(f"{CLI_RED}[server_error]{CLI_CLR} Sending response: outcome={outcome}, message={message}")
 
-    # Send response
-    try:
-        store_api.dispatch(dev.Req_ProvideAgentResponse(
-            outcome=outcome,
-            message=message,
-            links=[],
-        ))
-    except Exception as send_err:
-        print(f"{CLI_RED}[server_error]{CLI_CLR} Failed to send response: {send_err}")
-
-    # Complete task and check result (if core and task provided)
-    score = None
-    eval_logs = None
-    if core and task:
+        # Send response
         try:
-            result = core.complete_task(task)
-            if result.eval:
-                score = result.eval.score
-                eval_logs = result.eval.logs
-                if score == 0:
-                    print(f"{CLI_RED}[server_error]{CLI_CLR} Score: 0 | Error: {eval_logs}")
-                else:
-                    print(f"{CLI_YELLOW}[server_error]{CLI_CLR} Score: {score}")
-        except Exception as complete_err:
-            print(f"{CLI_RED}[server_error]{CLI_CLR} Failed to complete task: {complete_err}")
-
-    # Log task end
-    write_json_event(log_file, {
-        "role": "system",
-        "type": "task_end",
-        "reason": "server_error",
-        "status": status,
-        "method": method,
-        "error": error_msg,
-        "score": score,
-        "eval_logs": eval_logs,
-    })
-
-    # Raise to signal task termination (with score info)
-    exc = TaskTerminated(method, status, error_msg)
-    exc.score = score
-    exc.eval_logs = eval_logs
-    exc.task_completed = core is not None and task is not None
-    raise exc
+            store_api.dispatch(dev.Req_ProvideAgentResponse(
+                outcome=outcome,
+                message=message,
+                links=[],
+            ))
+        except Exception as send_err:
+            print(f"{CLI_RED}[server_error]{CLI_CLR} Failed to send response: {send_err}")
+
+        # Complete task and check result (if core and task provided)
+        score = None
+        eval_logs = None
+        if core and task:
+            try:
+                result = core.complete_task(task)
+                if result.eval:
+                    score = result.eval.score
+                    eval_logs = result.eval.logs
+                    if score == 0:
+                        print(f"{CLI_RED}[server_error]{CLI_CLR} Score: 0 | Error: {eval_logs}")
+                    else:
+                        print(f"{CLI_YELLOW}[server_error]{CLI_CLR} Score: {score}")
+            except Exception as complete_err:
+                print(f"{CLI_RED}[server_error]{CLI_CLR} Failed to complete task: {complete_err}")
+
+        # Log task end
+        write_json_event(log_file, {
+            "role": "system",
+            "type": "task_end",
+            "reason": "server_error",
+            "status": status,
+            "method": method,
+            "error": error_msg,
+            "score": score,
+            "eval_logs": eval_logs,
+        })
+
+        # Raise to signal task termination (with score info)
+        terminated = (method, status, error_msg, score, eval_logs, core is not None and task is not None)
+        if task_id is not None:
+            _terminated_tasks[task_id] = terminated
+        raise _task_terminated(*terminated)
 
 
 # =============================================================================
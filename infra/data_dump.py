@@ -6,6 +6,7 @@ Main function: dump_task_data(api, output_dir) - for use from main.py.
 
 import json
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Callable, Dict
 
@@ -20,7 +21,7 @@ def _load_employees(api, log: Callable[[str], None]) -> list:
     log("Loading employees...")
     summaries = paginate_all(api, dev.Req_ListEmployees, 'employees')
     t1 = time.perf_counter()
-    log(f"  {len(summaries)} found ({t1-t0:.1f}s), fetching details...")
+    log(f"  employees: {len(summaries)} found ({t1-t0:.1f}s), fetching details...")
 
     employees = []
     for emp in summaries:
@@ -29,10 +30,10 @@ def _load_employees(api, log: Callable[[str], None]) -> list:
             if result.employee:
                 employees.append(result.employee.model_dump())
         except Exception as e:
-            log(f"  ERROR {emp.id}: {e}")
+            log(f"  employees: ERROR {emp.id}: {e}")
 
     t2 = time.perf_counter()
-    log(f"  {len(employees)} loaded ({t2-t1:.1f}s)")
+    log(f"  employees: {len(employees)} loaded ({t2-t1:.1f}s)")
     return employees
 
 
@@ -42,7 +43,7 @@ def _load_projects(api, log: Callable[[str], None]) -> list:
     log("Loading projects...")
     summaries = paginate_all(api, dev.Req_SearchProjects, 'projects', query='', include_archived=True)
     t1 = time.perf_counter()
-    log(f"  {len(summaries)} found ({t1-t0:.1f}s), fetching details...")
+    log(f"  projects: {len(summaries)} found ({t1-t0:.1f}s), fetching details...")
 
     projects = []
     for proj in summaries:
@@ -51,10 +52,10 @@ def _load_projects(api, log: Callable[[str], None]) -> list:
             if result.project:
                 projects.append(result.project.model_dump())
         except Exception as e:
-            log(f"  ERROR {proj.id}: {e}")
+            log(f"  projects: ERROR {proj.id}: {e}")
 
     t2 = time.perf_counter()
-    log(f"  {len(projects)} loaded ({t2-t1:.1f}s)")
+    log(f"  projects: {len(projects)} loaded ({t2-t1:.1f}s)")
     return projects
 
 
@@ -64,7 +65,7 @@ def _load_customers(api, log: Callable[[str], None]) -> list:
     log("Loading customers...")
     summaries = paginate_all(api, dev.Req_ListCustomers, 'companies')
     t1 = time.perf_counter()
-    log(f"  {len(summaries)} found ({t1-t0:.1f}s), fetching details...")
+    log(f"  customers: {len(summaries)} found ({t1-t0:.1f}s), fetching details...")
 
     customers = []
     for cust in summaries:
@@ -73,10 +74,10 @@ def _load_customers(api, log: Callable[[str], None]) -> list:
             if result.company:
                 customers.append(result.company.model_dump())
         except Exception as e:
-            log(f"  ERROR {cust.id}: {e}")
+            log(f"  customers: ERROR {cust.id}: {e}")
 
     t2 = time.perf_counter()
-    log(f"  {len(customers)} loaded ({t2-t1:.1f}s)")
+    log(f"  customers: {len(customers)} loaded ({t2-t1:.1f}s)")
     return customers
 
 
@@ -92,11 +93,11 @@ def _load_time_entries(api, log: Callable[[str], None]) -> list:
         )
         all_entries = [e.model_dump() for e in entries]
     except Exception as ex:
-        log(f"  ERROR: {ex}")
+        log(f"  time entries: ERROR: {ex}")
         all_entries = []
 
     t1 = time.perf_counter()
-    log(f"  {len(all_entries)} loaded ({t1-t0:.1f}s)")
+    log(f"  time entries: {len(all_entries)} loaded ({t1-t0:.1f}s)")
     return all_entries
 
 
@@ -124,11 +125,11 @@ def dump_task_data(
 
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    # Load all entities
-    employees = _load_employees(api, log)
-    projects = _load_projects(api, log)
-    customers = _load_customers(api, log)
-    time_entries = _load_time_entries(api, log)
+    # Load all entities (independent fetches - run concurrently, so log lines name their entity)
+    loaders = (_load_employees, _load_projects, _load_customers, _load_time_entries)
+    with ThreadPoolExecutor(max_workers=len(loaders)) as ex:
+        futures = [ex.submit(loader, api, log) for loader in loaders]
+        employees, projects, customers, time_entries = [f.result() for f in futures]
 
     # Save to files
     (output_dir / "employees.json").write_text(
@@ -12,6 +12,10 @@ MIN_CHUNK_LENGTH = 40
 # Cache for loaded indexes
 _cache: dict[str, Embeddings] = {}
 
+# Cache for search results: (wiki_sha1, query, top_k) -> results
+_results_cache: dict[tuple[str, str, int], list[dict]] = {}
+RESULTS_CACHE_SIZE = 1024
+
 
 def index_wiki(wiki_sha1: str, section_delimiter: str = "##", rebuild: bool = False) -> int:
     """
@@ -63,6 +67,8 @@ def index_wiki(wiki_sha1: str, section_delimiter: str = "##", rebuild: bool = Fa
 
     # Invalidate cache
     _cache.pop(wiki_sha1, None)
+    for key in [k for k in _results_cache if k[0] == wiki_sha1]:
+        del _results_cache[key]
 
     return len(rows)
 
@@ -100,6 +106,29 @@ def search(wiki_sha1: str, query: str, top_k: int = 5) -> list[dict]:
     Search wiki index.
     Returns list of results: [{score, file_path, section_title, text}, ...]
     """
+    return search_many(wiki_sha1, [query], top_k)[0]
+
+
+def search_many(wiki_sha1: str, queries: list[str], top_k: int = 5) -> list[list[dict]]:
+    """
+    Search wiki index with several queries at once.
+    Returns one result list per query, in query order.
+
+    Uncached queries are run as one txtai batchsearch (queries are encoded
+    in a single model call); results are cached per (wiki_sha1, query, top_k).
+    """
+    missing = [q for q in dict.fromkeys(queries) if (wiki_sha1, q, top_k) not in _results_cache]
+    if missing:
+        batch = _load_index(wiki_sha1).batchsearch([_search_sql(q, top_k) for q in missing])
+        if len(_results_cache) + len(missing) > RESULTS_CACHE_SIZE:
+            _results_cache.clear()
+        for q, results in zip(missing, batch):
+            _results_cache[(wiki_sha1, q, top_k)] = results
+    return [_results_cache[(wiki_sha1, q, top_k)] for q in queries]
+
+
+def _load_index(wiki_sha1: str) -> Embeddings:
+    """Load wiki index (cached)."""
     if wiki_sha1 not in _cache:
         index_dir = INDEX_ROOT / wiki_sha1
         if not index_dir.exists():
@@ -107,12 +136,14 @@ def search(wiki_sha1: str, query: str, top_k: int = 5) -> list[dict]:
         emb = Embeddings()
         emb.load(str(index_dir))
         _cache[wiki_sha1] = emb
+    return _cache[wiki_sha1]
+
 
-    # SQL-style query to get all metadata fields
+def _search_sql(query: str, top_k: int) -> str:
+    """SQL-style query to get all metadata fields."""
     # Escape double quotes in query to prevent SQL injection
     escaped_query = query.replace('"', '\\"')
-    sql = f'SELECT id, text, file_path, section_title, score FROM txtai WHERE similar("{escaped_query}") LIMIT {top_k}'
-    return _cache[wiki_sha1].search(sql)
+    return f'SELECT id, text, file_path, section_title, score FROM txtai WHERE similar("{escaped_query}") LIMIT {top_k}'
 
 
 def _split_sections(text: str, delimiter: str) -> list[tuple[str | None, str]]:
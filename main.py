@@ -17,12 +17,14 @@ if sys.stderr.encoding != 'utf-8':
 
 from infra import (
     finalize_task, write_json_event,
-    TaskTerminated, ensure_wiki, reset_task_usage,
+    TaskTerminated, ensure_wiki, reset_task_usage, reset_terminated_tasks,
 )
 from infra.agent_log import set_task_dir, write_entry
 from config import AgentConfig, default_config
 from erc3 import ERC3, erc3 as dev, ApiException
-from tools.wrappers import paginate_all
+from tools.wrappers import invalidate_wiki_paths, paginate_all
+from tools.employee import reset_employee_cache
+from tools.pagination import reset_page_limit_cache, set_page_limit_override
 
 # Agents
 from agents import entity_extractor, watchdog, guest_handler, solver
@@ -67,6 +69,7 @@ args = parse_args()
 config = default_config
 if args.task_code:
     config.task_codes = [args.task_code]
+set_page_limit_override(config.page_limit)
 
 core = ERC3()
 
@@ -129,6 +132,13 @@ for task in status.tasks:
     if config.task_name_filter and config.task_name_filter.lower() not in task.task_text.lower():
         continue
 
+    # Reset per-task state before any API use (data dump, who_am_i, wiki):
+    # API response caches, discovered page limits, wiki listing, terminated tasks
+    reset_employee_cache()
+    reset_page_limit_cache()
+    invalidate_wiki_paths()
+    reset_terminated_tasks()
+
     # start the task
     print()  # Empty line before new task
     log_event(f"Task started: {task.spec_id}. {task.task_text}")
@@ -0,0 +1,96 @@
+"""
+Heavy optional dependencies for llm_time_stats.py.
+
+Imported only for large sessions (see llm_time_stats.enable_fastpath), so
+small sessions don't pay the orjson import cost. NumPy / Numba are imported
+later still, by load_agg_columns(), and only for inputs large enough to use
+the kernel. Each dependency is optional; missing ones fall back to the
+pure-Python path.
+
+Optional packages (not in requirements.txt): orjson, numpy, numba.
+"""
+
+import json
+
+try:
+    import orjson
+    loads = orjson.loads
+except ImportError:
+    loads = json.loads
+
+
+_agg_columns = None
+_agg_loaded = False
+
+
+def load_agg_columns():
+    """Return the Numba aggregation function, or None if NumPy/Numba are missing.
+
+    Imports NumPy/Numba and defines the kernel on first call only.
+    """
+    global _agg_columns, _agg_loaded
+    if _agg_loaded:
+        return _agg_columns
+    _agg_loaded = True
+
+    try:
+        import numpy as np
+        from numba import get_num_threads, njit, prange
+    except ImportError:
+        return None
+
+    @njit(parallel=True, cache=True)
+    def _agg_kernel(group_ids, values, serial_cols, n_groups, n_chunks):
+        """Count events and sum value columns per group id (negative ids are skipped).
+
+        Events are split into n_chunks chunks (one per thread); each chunk
+        sums into its own partial table so the prange loop needs no atomics.
+        Columns flagged in serial_cols (floats) are summed in one serial pass
+        in event order instead, so their totals match the pure-Python path
+        exactly (float addition depends on order; integer columns don't).
+        Only called from the main process (parse_sess_serv), never from the
+        task-parsing worker processes, so the threads do not oversubscribe CPUs.
+        """
+        n = group_ids.shape[0]
+        n_cols = values.shape[1]
+        chunk = (n + n_chunks - 1) // n_chunks
+        counts = np.zeros((n_chunks, n_groups), dtype=np.int64)
+        sums = np.zeros((n_chunks, n_groups, n_cols), dtype=np.float64)
+        for k in prange(n_chunks):
+            for i in range(k * chunk, min(n, (k + 1) * chunk)):
+                g = group_ids[i]
+                if g < 0:
+                    continue
+                counts[k, g] += 1
+                for j in range(n_cols):
+                    if not serial_cols[j]:
+                        sums[k, g, j] += values[i, j]
+        totals = sums.sum(axis=0)
+        for i in range(n):
+            g = group_ids[i]
+            if g < 0:
+                continue
+            for j in range(n_cols):
+                if serial_cols[j]:
+                    totals[g, j] += values[i, j]
+        return counts.sum(axis=0), totals
+
+    def agg_columns(group_ids: list, columns: list, n_groups: int, float_cols: tuple = ()) -> tuple:
+        """Run the Numba kernel over Python columns.
+
+        float_cols lists column positions holding floats (summed serially).
+        Returns (counts, sums) as lists: counts[g] and sums[g][j] per group.
+        """
+        serial_cols = np.zeros(len(columns), dtype=np.bool_)
+        serial_cols[list(float_cols)] = True
+        counts, sums = _agg_kernel(
+            np.asarray(group_ids, dtype=np.int64),
+            np.array(columns, dtype=np.float64).T,
+            serial_cols,
+            n_groups,
+            get_num_threads(),
+        )
+        return counts.tolist(), sums.tolist()
+
+    _agg_columns = agg_columns
+    return _agg_columns
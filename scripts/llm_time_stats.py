@@ -9,108 +9,259 @@ Usage:
 Output:
     1. JSON data (for programmatic use)
     2. Formatted report (for human reading)
+
+Optional (large sessions only, not in requirements.txt):
+    pip install orjson numpy numba
 """
 
+import heapq
 import json
+import os
 import re
 import sys
 from pathlib import Path
 from statistics import median
-from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, astuple, dataclass
+from typing import Iterator
+
+# Swapped for orjson by enable_fastpath() on large sessions
+_loads = json.loads
+_fastpath = None  # scripts/_fastpath module once enabled
+
+# Sessions with more log data than this load the optional fast path and
+# parse task dirs in worker processes (below it, process startup - spawn on
+# Windows especially - costs more than it saves)
+FASTPATH_MIN_BYTES = 10_000_000
+
+
+def enable_fastpath() -> None:
+    """Load the optional orjson parser from _fastpath (see FASTPATH_MIN_BYTES).
+
+    NumPy/Numba are not imported here: _aggregate loads them on demand for
+    inputs of at least NUMBA_MIN_EVENTS events.
+    """
+    global _loads, _fastpath
+    import _fastpath as fastpath
+    _fastpath = fastpath
+    _loads = fastpath.loads
+
+
+# Files above this size are read in chunks instead of all at once
+LARGE_FILE_BYTES = 50 * 1024 * 1024
+READ_CHUNK_BYTES = 8 * 1024 * 1024
+
+
+def _iter_lines(filepath: Path):
+    """Yield raw lines of a file, splitting on newlines in bulk."""
+    if filepath.stat().st_size <= LARGE_FILE_BYTES:
+        yield from filepath.read_bytes().split(b"\n")
+        return
+
+    # Large file: accumulate chunks, split off complete lines only
+    buf = bytearray()
+    with open(filepath, "rb") as f:
+        while chunk := f.read(READ_CHUNK_BYTES):
+            buf += chunk
+            end = buf.rfind(b"\n")
+            if end == -1:
+                continue
+            with memoryview(buf) as view:
+                lines = bytes(view[:end]).split(b"\n")
+            del buf[:end + 1]
+            yield from lines
+    if buf:
+        yield bytes(buf)
 
 
-def parse_jsonl(filepath: Path) -> list:
-    """Parse JSONL file."""
-    records = []
+def parse_jsonl(filepath: Path) -> Iterator[dict]:
+    """Parse JSONL file, yielding records one at a time."""
     try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    try:
-                        records.append(json.loads(line))
-                    except json.JSONDecodeError:
-                        pass
+        for line in _iter_lines(filepath):
+            if line:
+                try:
+                    record = _loads(line)
+                except ValueError:
+                    continue
+                yield record
     except Exception:
         pass
-    return records
 
 
-def parse_agent_logs(session_dir: Path) -> dict:
-    """Parse agent JSONL logs for cost and stats."""
+def session_log_bytes(session_dir: Path) -> int:
+    """Total size of a session's JSONL logs plus sess_serv.json."""
+    total = sum(f.stat().st_size for f in session_dir.rglob("*.jsonl"))
+    sess_serv_path = session_dir / "sess_serv.json"
+    if sess_serv_path.exists():
+        total += sess_serv_path.stat().st_size
+    return total
+
+
+def list_task_dirs(session_dir: Path) -> list:
+    """List task directories (t*) of a session.
 
-    models = defaultdict(lambda: {
-        "duration": 0.0,
-        "calls": 0,
-        "cost": 0.0,
-        "tokens": {"prompt": 0, "cached": 0, "completion": 0}
-    })
-    agents = defaultdict(lambda: {"cost": 0.0, "calls": 0})
-    task_costs = {}
+    os.scandir reuses the file type from the directory listing, so no
+    extra stat call is needed per entry.
+    """
+    with os.scandir(session_dir) as it:
+        return [Path(e.path) for e in it if e.name.startswith("t") and e.is_dir()]
 
-    # Find all task directories
-    task_dirs = [d for d in session_dir.iterdir() if d.is_dir() and d.name.startswith("t")]
 
+def _walk_session(task_dirs: list):
+    """Yield (task_id, {log_name: path}) per task dir, one scandir per directory."""
     for task_dir in task_dirs:
-        task_id = task_dir.name
-        task_costs[task_id] = 0.0
+        with os.scandir(task_dir) as it:
+            logs = {
+                sys.intern(e.name[:-len(".jsonl")]): Path(e.path)
+                for e in it if e.name.endswith(".jsonl") and e.is_file()
+            }
+        yield task_dir.name, logs
+
+
+@dataclass(slots=True)
+class ModelStats:
+    """Per-model accumulator for agent logs."""
+    duration: float = 0.0
+    calls: int = 0
+    cost: float = 0.0
+    tokens_prompt: int = 0
+    tokens_cached: int = 0
+    tokens_completion: int = 0
+
+    def add(self, duration, calls, cost, tokens_prompt, tokens_cached, tokens_completion) -> None:
+        """Add totals from a flat row (same field order)."""
+        self.duration += duration
+        self.calls += calls
+        self.cost += cost
+        self.tokens_prompt += tokens_prompt
+        self.tokens_cached += tokens_cached
+        self.tokens_completion += tokens_completion
+
+
+@dataclass(slots=True)
+class AgentStats:
+    """Per-agent accumulator for agent logs."""
+    cost: float = 0.0
+    calls: int = 0
+
+
+def _parse_task_dir(task_id: str, logs: dict) -> tuple:
+    """Parse logs of one task dir (runs in a worker process for large sessions).
+
+    Returns flat, cheap-to-pickle data:
+        (task_id, {model: ModelStats row tuple}, {agent: (cost, calls)}, task_cost, scores)
+    where scores is () or (score,).
+    """
+    models = {}  # model -> ModelStats
+    agents = {}  # agent_name -> (cost, calls)
+    task_cost = 0.0
+    scores = ()
+
+    for agent_name, jsonl_file in logs.items():
+        if agent_name == "task_result":
+            for r in parse_jsonl(jsonl_file):
+                if "score" in r:
+                    scores = (r["score"],)
+            continue
+
+        # Skip non-agent files
+        if agent_name == "resolved_objects":
+            continue
+
+        agent_cost = 0.0
+        agent_calls = 0
+        for r in parse_jsonl(jsonl_file):
+            stats = r.get("stats", {})
+            cost = stats.get("cost", 0) or 0
+            model = sys.intern(stats.get("model") or "unknown")
+            duration = stats.get("duration_sec", 0) or 0
+            tokens_prompt = stats.get("tokens_prompt", 0) or 0
+            tokens_cached = stats.get("tokens_cached", 0) or 0
+            tokens_completion = stats.get("tokens_completion", 0) or 0
+
+            if cost or duration:
+                m = models.get(model)
+                if m is None:
+                    m = models[model] = ModelStats()
+                m.cost += cost
+                m.duration += duration
+                m.calls += 1
+                m.tokens_prompt += tokens_prompt
+                m.tokens_cached += tokens_cached
+                m.tokens_completion += tokens_completion
+
+                agent_cost += cost
+                agent_calls += 1
+
+                task_cost += cost
+
+        if agent_calls:
+            agents[agent_name] = (agent_cost, agent_calls)
+
+    return (
+        task_id,
+        {model: astuple(m) for model, m in models.items()},
+        agents,
+        task_cost,
+        scores,
+    )
+
+
+def parse_agent_logs(task_dirs: list, parallel: bool = False) -> dict:
+    """Parse agent JSONL logs for cost and stats.
+
+    Task scores from task_result.jsonl are collected in the same pass.
+    With parallel=True (large sessions, see FASTPATH_MIN_BYTES) task dirs
+    are parsed in worker processes; per-task results are merged here.
+    """
+    task_logs = list(_walk_session(task_dirs))
+    if parallel and len(task_logs) > 1:
+        # Workers inherit the fast path under fork; the initializer covers spawn
+        initializer = enable_fastpath if _loads is not json.loads else None
+        with ProcessPoolExecutor(initializer=initializer) as ex:
+            per_task = list(ex.map(_parse_task_dir, *zip(*task_logs)))
+    else:
+        per_task = [_parse_task_dir(task_id, logs) for task_id, logs in task_logs]
 
-        # Parse agent logs
-        for jsonl_file in task_dir.glob("*.jsonl"):
-            agent_name = jsonl_file.stem
+    models = {}  # model -> ModelStats
+    agents = {}  # agent_name -> AgentStats
+    task_costs = {}
+    scores = {}
 
-            # Skip non-agent files
-            if agent_name in ("task_result", "resolved_objects"):
-                continue
+    for task_id, task_models, task_agents, task_cost, task_scores in per_task:
+        for model, row in task_models.items():
+            m = models.get(model)
+            if m is None:
+                m = models[model] = ModelStats()
+            m.add(*row)
 
-            records = parse_jsonl(jsonl_file)
-            for r in records:
-                stats = r.get("stats", {})
-                cost = stats.get("cost", 0) or 0
-                model = stats.get("model", "unknown")
-                duration = stats.get("duration_sec", 0) or 0
-                tokens_prompt = stats.get("tokens_prompt", 0) or 0
-                tokens_cached = stats.get("tokens_cached", 0) or 0
-                tokens_completion = stats.get("tokens_completion", 0) or 0
-
-                if cost or duration:
-                    models[model]["cost"] += cost
-                    models[model]["duration"] += duration
-                    models[model]["calls"] += 1
-                    models[model]["tokens"]["prompt"] += tokens_prompt
-                    models[model]["tokens"]["cached"] += tokens_cached
-                    models[model]["tokens"]["completion"] += tokens_completion
-
-                    agents[agent_name]["cost"] += cost
-                    agents[agent_name]["calls"] += 1
-
-                    task_costs[task_id] += cost
+        for agent_name, (agent_cost, agent_calls) in task_agents.items():
+            a = agents.get(agent_name)
+            if a is None:
+                a = agents[agent_name] = AgentStats()
+            a.cost += agent_cost
+            a.calls += agent_calls
+
+        task_costs[task_id] = task_cost
+        if task_scores:
+            scores[task_id] = task_scores[0]
 
     return {
-        "models": dict(models),
-        "agents": dict(agents),
+        "models": {model: asdict(m) for model, m in models.items()},
+        "agents": {name: asdict(a) for name, a in agents.items()},
         "task_costs": task_costs,
-        "total_cost": sum(models[m]["cost"] for m in models),
+        "total_cost": sum(m.cost for m in models.values()),
+        "scores": scores,
     }
 
 
-def parse_task_results(session_dir: Path) -> dict:
-    """Parse task_result.jsonl files for scores."""
-    scores = {}
-
-    task_dirs = [d for d in session_dir.iterdir() if d.is_dir() and d.name.startswith("t")]
-
-    for task_dir in task_dirs:
-        task_id = task_dir.name
-        result_file = task_dir / "task_result.jsonl"
-
-        if result_file.exists():
-            records = parse_jsonl(result_file)
-            for r in records:
-                if "score" in r:
-                    scores[task_id] = r["score"]
-
-    return scores
+_CATEGORY_RE = re.compile(r"category='([^']*)'")
+_MODEL_RE = re.compile(r"'model':\s*'([^']*)'")
+_DURATION_RE = re.compile(r"'duration_sec':\s*([\d.]+)")
+_PROMPT_RE = re.compile(r"'prompt_tokens':\s*(\d+)")
+_CACHED_RE = re.compile(r"'cached_prompt_tokens':\s*(\d+)")
+_COMPLETION_RE = re.compile(r"'completion_tokens':\s*(\d+)")
+_BRACE_RE = re.compile(r"[{}]")
 
 
 def parse_log_message(message: str) -> dict:
@@ -118,7 +269,7 @@ def parse_log_message(message: str) -> dict:
     result = {}
 
     # Extract category
-    cat_match = re.search(r"category='([^']*)'", message)
+    cat_match = _CATEGORY_RE.search(message)
     if cat_match:
         result["category"] = cat_match.group(1)
 
@@ -126,38 +277,39 @@ def parse_log_message(message: str) -> dict:
     body_start = message.find("body={")
     if body_start != -1:
         body_start += 5  # skip "body="
+        # Let the regex engine jump between braces instead of stepping per char
         depth = 0
         body_end = body_start
-        for i, c in enumerate(message[body_start:], body_start):
-            if c == '{':
+        for brace in _BRACE_RE.finditer(message, body_start):
+            if brace.group() == '{':
                 depth += 1
-            elif c == '}':
+            else:
                 depth -= 1
                 if depth == 0:
-                    body_end = i + 1
+                    body_end = brace.end()
                     break
 
         body_str = message[body_start:body_end]
         try:
             body = {}
 
-            model_match = re.search(r"'model':\s*'([^']*)'", body_str)
+            model_match = _MODEL_RE.search(body_str)
             if model_match:
-                body["model"] = model_match.group(1)
+                body["model"] = sys.intern(model_match.group(1))
 
-            duration_match = re.search(r"'duration_sec':\s*([\d.]+)", body_str)
+            duration_match = _DURATION_RE.search(body_str)
             if duration_match:
                 body["duration_sec"] = float(duration_match.group(1))
 
-            prompt_match = re.search(r"'prompt_tokens':\s*(\d+)", body_str)
+            prompt_match = _PROMPT_RE.search(body_str)
             if prompt_match:
                 body["prompt_tokens"] = int(prompt_match.group(1))
 
-            cached_match = re.search(r"'cached_prompt_tokens':\s*(\d+)", body_str)
+            cached_match = _CACHED_RE.search(body_str)
             if cached_match:
                 body["cached_prompt_tokens"] = int(cached_match.group(1))
 
-            completion_match = re.search(r"'completion_tokens':\s*(\d+)", body_str)
+            completion_match = _COMPLETION_RE.search(body_str)
             if completion_match:
                 body["completion_tokens"] = int(completion_match.group(1))
 
@@ -168,16 +320,67 @@ def parse_log_message(message: str) -> dict:
     return result
 
 
+# Accumulator row layout produced by _aggregate(): [calls, duration, prompt, cached, completion]
+IDX_CALLS, IDX_DUR, IDX_PROMPT, IDX_CACHED, IDX_COMPL = range(5)
+
+
+def _row_to_stats(row: list) -> dict:
+    """Convert accumulator row to the nested stats dict used in output."""
+    return {
+        "duration": round(row[IDX_DUR], 2),
+        "calls": row[IDX_CALLS],
+        "tokens": {
+            "prompt": row[IDX_PROMPT],
+            "cached": row[IDX_CACHED],
+            "completion": row[IDX_COMPL],
+        },
+    }
+
+
+# Below this many events the JIT dispatch/compile cost is not worth it
+NUMBA_MIN_EVENTS = 100_000
+
+
+def _aggregate(group_ids: list, columns: list, n_groups: int) -> list:
+    """Sum telemetry columns into one accumulator row per group id.
+
+    columns are (durations, prompts, cached, completions); rows follow the
+    IDX_* layout. Uses the Numba kernel for large inputs when the fast path
+    is enabled and numba is installed, plain Python otherwise. Events with
+    group id -1 are skipped.
+    """
+    agg_columns = None
+    if _fastpath is not None and len(group_ids) >= NUMBA_MIN_EVENTS:
+        agg_columns = _fastpath.load_agg_columns()
+    if agg_columns is not None:
+        counts, sums = agg_columns(group_ids, columns, n_groups, float_cols=(0,))  # durations
+        return [[c, d, int(p), int(x), int(o)] for c, (d, p, x, o) in zip(counts, sums)]
+
+    rows = [[0, 0.0, 0, 0, 0] for _ in range(n_groups)]
+    durations, prompts, cached, completions = columns
+    for g, d, p, x, o in zip(group_ids, durations, prompts, cached, completions):
+        if g < 0:
+            continue
+        r = rows[g]
+        r[IDX_CALLS] += 1
+        r[IDX_DUR] += d
+        r[IDX_PROMPT] += p
+        r[IDX_CACHED] += x
+        r[IDX_COMPL] += o
+    return rows
+
+
 def parse_sess_serv(sess_serv_path: Path) -> dict:
-    """Parse sess_serv.json and extract LLM stats."""
+    """Parse sess_serv.json and extract LLM stats.
 
-    tasks = {}  # spec_id -> stats
-    models = defaultdict(lambda: {
-        "duration": 0.0,
-        "calls": 0,
-        "tokens": {"prompt": 0, "cached": 0, "completion": 0}
-    })
-    current_task = None
+    Telemetry events are first extracted into columns, then summed per
+    task and per model by _aggregate().
+    """
+
+    task_index = {}   # spec_id -> group id
+    model_index = {}  # model -> group id
+    ev_task, ev_model, ev_dur, ev_prompt, ev_cached, ev_compl = [], [], [], [], [], []
+    current_task = -1
 
     with open(sess_serv_path, "r", encoding="utf-8") as f:
         data = json.load(f)
@@ -186,18 +389,17 @@ def parse_sess_serv(sess_serv_path: Path) -> dict:
         event_type = event.get("type")
 
         if event_type == "task_start":
-            current_task = event.get("spec_id")
-            if current_task and current_task not in tasks:
-                tasks[current_task] = {
-                    "duration": 0.0,
-                    "calls": 0,
-                    "tokens": {"prompt": 0, "cached": 0, "completion": 0}
-                }
+            spec_id = event.get("spec_id")
+            current_task = task_index.setdefault(spec_id, len(task_index)) if spec_id else -1
 
         elif event_type == "task_log":
             log = event.get("log", {})
             message = log.get("message", "")
 
+            # Cheap substring check before regex + brace scan
+            if "category='telemetry'" not in message:
+                continue
+
             parsed = parse_log_message(message)
 
             if parsed.get("category") == "telemetry":
@@ -207,43 +409,46 @@ def parse_sess_serv(sess_serv_path: Path) -> dict:
                 if duration is None:
                     continue
 
-                prompt_tokens = body.get("prompt_tokens", 0)
-                cached_tokens = body.get("cached_prompt_tokens", 0)
-                completion_tokens = body.get("completion_tokens", 0)
                 model = body.get("model", "unknown")
 
-                # Add to current task
-                if current_task and current_task in tasks:
-                    tasks[current_task]["duration"] += duration
-                    tasks[current_task]["calls"] += 1
-                    tasks[current_task]["tokens"]["prompt"] += prompt_tokens
-                    tasks[current_task]["tokens"]["cached"] += cached_tokens
-                    tasks[current_task]["tokens"]["completion"] += completion_tokens
-
-                # Add to model stats
-                models[model]["duration"] += duration
-                models[model]["calls"] += 1
-                models[model]["tokens"]["prompt"] += prompt_tokens
-                models[model]["tokens"]["cached"] += cached_tokens
-                models[model]["tokens"]["completion"] += completion_tokens
+                ev_task.append(current_task)
+                ev_model.append(model_index.setdefault(model, len(model_index)))
+                ev_dur.append(duration)
+                ev_prompt.append(body.get("prompt_tokens", 0))
+                ev_cached.append(body.get("cached_prompt_tokens", 0))
+                ev_compl.append(body.get("completion_tokens", 0))
+
+    columns = [ev_dur, ev_prompt, ev_cached, ev_compl]
+    tasks = dict(zip(task_index, _aggregate(ev_task, columns, len(task_index))))
+    models = dict(zip(model_index, _aggregate(ev_model, columns, len(model_index))))
 
     # Calculate session summary
     if tasks:
-        durations = [t["duration"] for t in tasks.values()]
-        calls = [t["calls"] for t in tasks.values()]
+        # Single pass over tasks for all totals
+        durations = []
+        total_dur = 0.0
+        total_calls = total_prompt = total_cached = total_compl = 0
+        for t in tasks.values():
+            durations.append(t[IDX_DUR])
+            total_dur += t[IDX_DUR]
+            total_calls += t[IDX_CALLS]
+            total_prompt += t[IDX_PROMPT]
+            total_cached += t[IDX_CACHED]
+            total_compl += t[IDX_COMPL]
+        task_count = len(tasks)
 
         summary = {
-            "total_duration": round(sum(durations), 2),
-            "total_calls": sum(calls),
+            "total_duration": round(total_dur, 2),
+            "total_calls": total_calls,
             "total_tokens": {
-                "prompt": sum(t["tokens"]["prompt"] for t in tasks.values()),
-                "cached": sum(t["tokens"]["cached"] for t in tasks.values()),
-                "completion": sum(t["tokens"]["completion"] for t in tasks.values())
+                "prompt": total_prompt,
+                "cached": total_cached,
+                "completion": total_compl
             },
-            "task_count": len(tasks),
-            "avg_duration_per_task": round(sum(durations) / len(durations), 2),
+            "task_count": task_count,
+            "avg_duration_per_task": round(total_dur / task_count, 2),
             "median_duration_per_task": round(median(durations), 2),
-            "avg_calls_per_task": round(sum(calls) / len(calls), 2)
+            "avg_calls_per_task": round(total_calls / task_count, 2)
         }
     else:
         summary = {
@@ -256,18 +461,10 @@ def parse_sess_serv(sess_serv_path: Path) -> dict:
             "avg_calls_per_task": 0
         }
 
-    # Round task durations
-    for t in tasks.values():
-        t["duration"] = round(t["duration"], 2)
-
-    # Round model durations
-    for m in models.values():
-        m["duration"] = round(m["duration"], 2)
-
     return {
-        "tasks": tasks,
+        "tasks": {tid: _row_to_stats(t) for tid, t in tasks.items()},
         "session": summary,
-        "models": dict(models)
+        "models": {model: _row_to_stats(m) for model, m in models.items()}
     }
 
 
@@ -308,25 +505,24 @@ def print_report(stats: dict, session_name: str, agent_stats: dict = None, score
     if agent_stats:
         print(f"\n{'Model':<20} {'Cost':>10} {'Prompt':>8} {'Compl':>8}")
         print("-" * 48)
-        for model in sorted(agent_stats["models"].keys()):
-            m = agent_stats["models"][model]
-            short_name = model.split("/")[-1] if "/" in model else model
+        for model, m in sorted(agent_stats["models"].items()):
+            short_name = model.rpartition("/")[2]
             cost_str = f"${m['cost']:.4f}"
-            print(f"{short_name:<20} {cost_str:>10} {fmt_k(m['tokens']['prompt']):>8} {fmt_k(m['tokens']['completion']):>8}")
+            print(f"{short_name:<20} {cost_str:>10} {fmt_k(m['tokens_prompt']):>8} {fmt_k(m['tokens_completion']):>8}")
     else:
         # Fallback to old format
         print(f"\n{'Model':<18} {'Time':>8} {'Calls':>6} {'Prompt':>8} {'Cached':>8} {'Compl':>8}")
         print("-" * 60)
         for model, m in sorted(models.items()):
-            short_name = model.split("/")[-1] if "/" in model else model
+            short_name = model.rpartition("/")[2]
             print(f"{short_name:<18} {m['duration']:>8.1f} {m['calls']:>6} {fmt_k(m['tokens']['prompt']):>8} {fmt_k(m['tokens']['cached']):>8} {fmt_k(m['tokens']['completion']):>8}")
 
     # Top 3 longest tasks
-    sorted_tasks = sorted(tasks.items(), key=lambda x: x[1]["duration"], reverse=True)
+    top_tasks = heapq.nlargest(3, tasks.items(), key=lambda x: x[1]["duration"])
     print(f"\nTop 3 longest tasks:")
     print(f"{'Task':<8} {'Time':>8} {'Calls':>6}")
     print("-" * 24)
-    for tid, t in sorted_tasks[:3]:
+    for tid, t in top_tasks:
         print(f"{tid:<8} {t['duration']:>8.1f} {t['calls']:>6}")
 
 
@@ -343,11 +539,15 @@ def main():
         print(f"Error: {session_dir} not found")
         sys.exit(1)
 
-    # Parse agent logs for cost (new)
-    agent_stats = parse_agent_logs(session_dir)
+    # Heavy parsers and worker processes only pay off on large sessions
+    large_session = session_log_bytes(session_dir) > FASTPATH_MIN_BYTES
+    if large_session:
+        enable_fastpath()
 
-    # Parse task results for scores (new)
-    scores = parse_task_results(session_dir)
+    # Parse agent logs for cost and task results for scores (single walk)
+    task_dirs = list_task_dirs(session_dir)
+    agent_stats = parse_agent_logs(task_dirs, parallel=large_session)
+    scores = agent_stats["scores"]
 
     # Parse sess_serv.json for duration/tokens (original)
     sess_serv_path = session_dir / "sess_serv.json"
@@ -3,7 +3,7 @@
 from enum import Enum
 from typing import Annotated, List, Literal, Optional, Union
 from annotated_types import MaxLen
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Discriminator, Field, Tag, field_validator
 from erc3 import erc3 as dev
 
 from tools.employee import EmployeeExtInfo
@@ -314,9 +314,27 @@ class FilterSpecific(BaseModel):
     name: str = Field(..., description="Skill or will ID (e.g., 'skill_qms', 'will_travel')")
     levels: List[SkillLevelName] = Field(..., description="Level names to include: 'Strong', 'Exceptional', etc.")
 
+    @field_validator("levels", mode="after")
+    @classmethod
+    def _dedupe_levels(cls, v: List[str]) -> List[str]:
+        # Drop repeated names once at parse time (order kept); stays a list for the LLM schema
+        return list(dict.fromkeys(v))
 
-# Union type for skill/will criteria
-Criterion = Union[FilterMost, FilterLeast, FilterSpecific]
+
+def _criterion_mode(v) -> str:
+    # Missing 'mode' falls back to MOST, as every Filter model defaults it
+    return v.get("mode", "MOST") if isinstance(v, dict) else getattr(v, "mode", "MOST")
+
+
+# Union type for skill/will criteria (validated by 'mode' tag, no trial parsing)
+Criterion = Annotated[
+    Union[
+        Annotated[FilterMost, Tag("MOST")],
+        Annotated[FilterLeast, Tag("LEAST")],
+        Annotated[FilterSpecific, Tag("SPECIFIC")],
+    ],
+    Discriminator(_criterion_mode),
+]
 
 
 class Req_SearchEmployees(BaseModel):
@@ -6,20 +6,52 @@ Sources:
 - API: Req_SearchProjects + Req_GetProject (projects)
 """
 
-from typing import List, Optional
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
 
-from pydantic import BaseModel
-from infra import TaskTerminated
+from pydantic import BaseModel, field_serializer, field_validator
+from infra import TaskTerminated, handle_api_error
 
 from erc3 import erc3 as dev
 
+from tools.pagination import paginate_iter
+
 # Operational departments (production, logistics, quality)
-OPERATIONAL_DEPARTMENTS = {
+OPERATIONAL_DEPARTMENTS = frozenset({
     "Production – Italy",
     "Production – Serbia",
     "Logistics & Supply Chain",
     "Quality & HSE",
-}
+})
+
+EXECUTIVE_DEPARTMENT = "Corporate Leadership"
+
+# department -> (is_executive, is_operational); other departments: (False, False)
+_DEPT_FLAGS = {dept: (False, True) for dept in OPERATIONAL_DEPARTMENTS}
+_DEPT_FLAGS[EXECUTIVE_DEPARTMENT] = (True, False)
+
+# Max concurrent GetProject requests per call (security view, workload, project leads)
+PROJECT_FETCH_WORKERS = 8
+
+# Employee project searches run here, overlapping the GetEmployee call
+# (only _get_employee_projects is submitted, so workers never wait on this pool)
+_PROJECTS_EXEC = ThreadPoolExecutor(max_workers=16, thread_name_prefix="emp-projects")
+
+
+@dataclass(frozen=True, slots=True)
+class _MissingEmployee:
+    """Fallback stub used in place of an API employee when GetEmployee fails (404)."""
+    id: str
+    name: str = '<employee not found>'
+    email: str = ''
+    salary: int = 0
+    notes: str = ''
+    location: str = ''
+    department: str = ''
+    skills: tuple = ()
+    wills: tuple = ()
 
 
 class ProjectBrief(BaseModel):
@@ -30,6 +62,19 @@ class ProjectBrief(BaseModel):
     status: str         # idea, exploring, active, paused, archived
 
 
+# Skill/will row kept as (skill_will_id, level); serialized as
+# {"skill_will_id": ..., "level": ...} objects
+SkillRow = Tuple[str, int]
+SKILL_KEY, LEVEL_KEY = "skill_will_id", "level"
+
+
+def skill_rows_to_dicts(rows: Optional[Tuple[SkillRow, ...]]) -> Optional[List[dict]]:
+    """Expand (skill_will_id, level) rows to their public JSON shape."""
+    if rows is None:
+        return None
+    return [{SKILL_KEY: name, LEVEL_KEY: level} for name, level in rows]
+
+
 class EmployeeExtInfo(BaseModel):
     """Employee information from API + projects.
 
@@ -45,12 +90,24 @@ class EmployeeExtInfo(BaseModel):
     notes: Optional[str] = None
     location: Optional[str] = None
     department: Optional[str] = None
-    skills: Optional[List[dict]] = None
-    wills: Optional[List[dict]] = None
+    skills: Optional[Tuple[SkillRow, ...]] = None
+    wills: Optional[Tuple[SkillRow, ...]] = None
 
     # FROM: SearchProjects API (fetched only if requested)
     projects: Optional[List[ProjectBrief]] = None
 
+    @field_validator("skills", "wills", mode="before")
+    @classmethod
+    def _rows_from_dicts(cls, value):
+        """Accept rows in their serialized {"skill_will_id", "level"} form."""
+        if value and isinstance(value[0], dict):
+            return tuple((row[SKILL_KEY], row[LEVEL_KEY]) for row in value)
+        return value
+
+    @field_serializer("skills", "wills")
+    def _rows_to_dicts(self, rows):
+        return skill_rows_to_dicts(rows)
+
 
 # =============================================================================
 # Security View — for access control checks
@@ -86,6 +143,128 @@ class EmployeeSecurityView(BaseModel):
     projects: List[ProjectSecurityView] = []
 
 
+# =============================================================================
+# Per-task API response cache — build_employee_* are often called for
+# overlapping employees/projects within one task. Reset at task start.
+# =============================================================================
+
+_employee_cache = {}           # (id(api), employee_id) -> Employee (GetEmployee)
+_project_cache = {}            # (id(api), project_id) -> Project (GetProject)
+_employee_projects_cache = {}  # (id(api), employee_id, include_archived) -> tuple of projects (SearchProjects)
+_inflight = {}                 # ("employee" | "project", (id(api), id)) -> Future of a GET shared by concurrent callers
+_inflight_lock = threading.Lock()
+
+
+def reset_employee_cache() -> None:
+    """Clear cached API responses (call at task start)."""
+    _employee_cache.clear()
+    _project_cache.clear()
+    _employee_projects_cache.clear()
+    with _inflight_lock:
+        _inflight.clear()
+
+
+def invalidate_employee(employee_id: str) -> None:
+    """Drop cached GetEmployee response after the employee was updated."""
+    with _inflight_lock:
+        _drop_cached(_employee_cache, "employee", employee_id)
+
+
+def invalidate_project(project_id: str) -> None:
+    """Drop cached project data after the project (status/team) was updated."""
+    with _inflight_lock:
+        _drop_cached(_project_cache, "project", project_id)
+    # Team changes affect which employees the project is listed for
+    _employee_projects_cache.clear()
+
+
+def _drop_cached(cache: dict, kind: str, entity_id: str) -> None:
+    """Drop cached and in-flight entries of an entity for every API client (hold _inflight_lock)."""
+    for key in [k for k in cache if k[1] == entity_id]:
+        del cache[key]
+    for key in [k for k in _inflight if k[0] == kind and k[1][1] == entity_id]:
+        del _inflight[key]
+
+
+def _get_coalesced(cache: dict, kind: str, key: tuple, fetch):
+    """Read through cache; concurrent misses for the same key share one API call.
+
+    The first caller runs fetch() and hands its result (or error) to the
+    others via a Future. The result is cached unless it is None or the key
+    was invalidated while the call was in flight.
+    """
+    value = cache.get(key)
+    if value is not None:
+        return value
+
+    inflight_key = (kind, key)
+    with _inflight_lock:
+        value = cache.get(key)
+        if value is not None:
+            return value
+        future = _inflight.get(inflight_key)
+        if future is None:
+            future = _inflight[inflight_key] = Future()
+            owner = True
+        else:
+            owner = False
+    if not owner:
+        return future.result()
+
+    try:
+        value = fetch()
+    except BaseException as e:
+        with _inflight_lock:
+            if _inflight.get(inflight_key) is future:
+                del _inflight[inflight_key]
+        future.set_exception(e)
+        raise
+    with _inflight_lock:
+        if _inflight.get(inflight_key) is future:
+            del _inflight[inflight_key]
+            if value is not None:
+                cache[key] = value
+    future.set_result(value)
+    return value
+
+
+def get_employee_cached(api, employee_id: str):
+    """GetEmployee through the per-task cache. Errors propagate uncached."""
+    return _get_coalesced(
+        _employee_cache, "employee", (id(api), employee_id),
+        lambda: api.dispatch(dev.Req_GetEmployee(id=employee_id)).employee,
+    )
+
+
+def get_project_cached(api, project_id: str):
+    """GetProject through the per-task cache. Returns project or None."""
+    return _get_coalesced(
+        _project_cache, "project", (id(api), project_id),
+        lambda: api.dispatch(dev.Req_GetProject(id=project_id)).project,
+    )
+
+
+def _search_employee_projects(api, employee_id: str, include_archived: bool = True) -> tuple:
+    """SearchProjects by team member through the per-task cache.
+
+    Shared by _get_employee_projects and build_employee_security_view, so
+    building both views for one employee runs the paginated search once.
+    Keyed by API client as well, so results never leak between clients.
+    """
+    key = (id(api), employee_id, include_archived)
+    projects = _employee_projects_cache.get(key)
+    if projects is None:
+        projects = tuple(paginate_iter(
+            api,
+            dev.Req_SearchProjects,
+            'projects',
+            include_archived=include_archived,
+            team=dev.ProjectTeamFilter(employee_id=employee_id)
+        ))
+        _employee_projects_cache[key] = projects
+    return projects
+
+
 def _get_employee_projects(
     api,
     employee_id: str,
@@ -112,17 +291,8 @@ def _get_employee_projects(
     Raises:
         TaskTerminated: If server error occurs
     """
-    from tools.wrappers import paginate_all
-    from infra import handle_api_error
-
     try:
-        projects = paginate_all(
-            api,
-            dev.Req_SearchProjects,
-            'projects',
-            include_archived=True,
-            team=dev.ProjectTeamFilter(employee_id=employee_id)
-        )
+        projects = _search_employee_projects(api, employee_id)
     except TaskTerminated:
         raise  # Re-raise immediately, task already completed
     except Exception as e:
@@ -131,17 +301,28 @@ def _get_employee_projects(
         # 404 or no store_api - return empty
         return []
 
-    # Convert SearchProjects results to ProjectBrief (no extra API calls)
-    result = []
-    for proj in projects:
-        result.append(ProjectBrief(
-            id=proj.id,
-            name=proj.name,
-            customer=proj.customer or "",
-            status=proj.status or "",
-        ))
+    # Convert SearchProjects results to ProjectBrief (no extra API calls).
+    # Data comes from validated API responses, so skip re-validation.
+    construct = ProjectBrief.model_construct
+    return [
+        construct(id=proj.id, name=proj.name, customer=proj.customer or "", status=proj.status or "")
+        for proj in projects
+    ]
+
+
+def _skill_rows(items) -> Tuple[SkillRow, ...]:
+    """Convert API skill/will entries to (skill_will_id, level) rows."""
+    if not items:
+        return ()
+    return tuple((item.name, item.level) for item in items)
+
 
-    return result
+def _stop_future(future: Optional[Future]) -> None:
+    """Cancel a background request and wait for it, so it can't outlive its task."""
+    if future is None:
+        return
+    future.cancel()
+    wait([future])
 
 
 def build_employee_ext_info(
@@ -171,35 +352,34 @@ def build_employee_ext_info(
     Raises:
         TaskTerminated: If server error occurs (response already sent)
     """
-    from infra import handle_api_error
+    # Start the project search first so it runs alongside GetEmployee
+    projects_future = None
+    if include_projects:
+        projects_future = _PROJECTS_EXEC.submit(
+            _get_employee_projects, api, employee_id, store_api, log_file, core, task
+        )
 
     # 1. Get employee from API
     try:
-        resp = api.dispatch(dev.Req_GetEmployee(id=employee_id))
-        emp = resp.employee
+        emp = get_employee_cached(api, employee_id)
     except TaskTerminated:
+        _stop_future(projects_future)
         raise
     except Exception as e:
         if store_api:
-            handle_api_error(e, "GetEmployee", store_api, log_file, core, task)
+            try:
+                handle_api_error(e, "GetEmployee", store_api, log_file, core, task)
+            except BaseException:
+                _stop_future(projects_future)
+                raise
         # 404 - use fallback stub
-        emp = type('Employee', (), {
-            'id': employee_id,
-            'name': '<employee not found>',
-            'email': '',
-            'salary': 0,
-            'notes': '',
-            'location': '',
-            'department': '',
-            'skills': [],
-            'wills': [],
-        })()
+        emp = _MissingEmployee(id=employee_id)
 
     # 2. Get projects (optional)
     projects = []
-    if include_projects:
+    if projects_future is not None:
         try:
-            projects = _get_employee_projects(api, employee_id, store_api, log_file, core, task)
+            projects = projects_future.result()
         except TaskTerminated:
             raise
         except Exception as e:
@@ -207,7 +387,7 @@ def build_employee_ext_info(
                 handle_api_error(e, "GetEmployeeProjects", store_api, log_file, core, task)
             projects = []
 
-    return EmployeeExtInfo(
+    return EmployeeExtInfo.model_construct(
         id=emp.id,
         name=emp.name,
         email=emp.email,
@@ -215,8 +395,8 @@ def build_employee_ext_info(
         notes=emp.notes,
         location=emp.location,
         department=emp.department,
-        skills=[{"skill_will_id": s.name, "level": s.level} for s in emp.skills] if emp.skills else [],
-        wills=[{"skill_will_id": w.name, "level": w.level} for w in emp.wills] if emp.wills else [],
+        skills=_skill_rows(emp.skills),
+        wills=_skill_rows(emp.wills),
         projects=projects,
     )
 
@@ -246,86 +426,73 @@ def build_employee_security_view(
     Raises:
         TaskTerminated: If server error occurs (response already sent)
     """
-    from tools.wrappers import paginate_all
-    from infra import handle_api_error
-
     # 1. Get employee from API
     try:
-        resp = api.dispatch(dev.Req_GetEmployee(id=employee_id))
-        emp = resp.employee
+        emp = get_employee_cached(api, employee_id)
     except TaskTerminated:
         raise
     except Exception as e:
         if store_api:
             handle_api_error(e, "GetEmployee", store_api, log_file, core, task)
         # 404 or no store_api - use fallback stub
-        emp = type('Employee', (), {
-            'id': employee_id,
-            'name': '<employee not found>',
-            'location': '',
-            'department': '',
-        })()
+        emp = _MissingEmployee(id=employee_id)
 
-    # 2. Determine is_executive
-    is_executive = emp.department == "Corporate Leadership"
+    # 2. Determine is_executive / is_operational
+    is_executive, is_operational = _DEPT_FLAGS.get(emp.department, (False, False))
 
     # 3. Get projects where employee participates
     projects_security = []
     try:
-        projects = paginate_all(
-            api,
-            dev.Req_SearchProjects,
-            'projects',
-            include_archived=True,
-            team=dev.ProjectTeamFilter(employee_id=employee_id)
-        )
+        projects = _search_employee_projects(api, employee_id)
     except TaskTerminated:
         raise
     except Exception as e:
         if store_api:
             handle_api_error(e, "SearchProjects", store_api, log_file, core, task)
-        projects = []
-
-    # 4. For each project, get full details (team)
-    for proj in projects:
-        try:
-            full = api.dispatch(dev.Req_GetProject(id=proj.id))
-            if not full.project:
-                continue
-
-            # Find this employee's role in team
-            my_role = ""
-            team_members = []
-            for member in full.project.team or []:
-                team_members.append(TeamMember(
-                    employee=member.employee,
-                    role_in_project=member.role or "",
-                    time_slice=member.time_slice or 0.0,
+        projects = ()
+
+    # 4. Get full details (team) for all projects concurrently, in original order
+    with ThreadPoolExecutor(max_workers=PROJECT_FETCH_WORKERS) as ex:
+        futures = [ex.submit(get_project_cached, api, proj.id) for proj in projects]
+        for fut in futures:
+            try:
+                project = fut.result()
+                if not project:
+                    continue
+
+                # Find this employee's role in team
+                my_role = ""
+                team_members = []
+                for member in project.team or []:
+                    team_members.append(TeamMember.model_construct(
+                        employee=member.employee,
+                        role_in_project=member.role or "",
+                        time_slice=member.time_slice or 0.0,
+                    ))
+                    if member.employee == employee_id:
+                        my_role = member.role or ""
+
+                projects_security.append(ProjectSecurityView.model_construct(
+                    id=project.id,
+                    status=project.status or "",
+                    role_in_project=my_role,
+                    team=team_members,
                 ))
-                if member.employee == employee_id:
-                    my_role = member.role or ""
-
-            projects_security.append(ProjectSecurityView(
-                id=full.project.id,
-                status=full.project.status or "",
-                role_in_project=my_role,
-                team=team_members,
-            ))
-        except TaskTerminated:
-            raise
-        except Exception as e:
-            if store_api:
-                handle_api_error(e, "GetProject", store_api, log_file, core, task)
-            # 404 - skip this project
-            continue
+            except TaskTerminated:
+                raise
+            except Exception as e:
+                if store_api:
+                    handle_api_error(e, "GetProject", store_api, log_file, core, task)
+                # 404 - skip this project
+                continue
 
-    return EmployeeSecurityView(
+    return EmployeeSecurityView.model_construct(
         id=emp.id,
         name=emp.name,
         location=emp.location,
         department=emp.department,
         is_executive=is_executive,
-        is_operational=emp.department in OPERATIONAL_DEPARTMENTS,
+        is_operational=is_operational,
         projects=projects_security,
     )
 
@@ -0,0 +1,152 @@
+"""Pagination helpers for erc3 list/search requests.
+
+Kept separate from tools.wrappers so tools.employee can import it at
+module level (wrappers imports employee).
+"""
+
+from operator import attrgetter
+from typing import Any, Iterator, Optional
+
+from erc3 import ApiException
+
+
+# Error message when server pagination is completely broken (max_limit = -1)
+# IMPORTANT: This message must clearly indicate SERVER ERROR so agent uses 'server_error' outcome
+SERVER_SYSTEM_ERROR = "SERVER ERROR: The server API is broken and not responding correctly. Use outcome 'server_error' when reporting this."
+
+
+class ServerSystemError(Exception):
+    """Raised when server API is broken (e.g., pagination disabled)."""
+    pass
+
+
+# First page limit to try; halved on "page limit exceeded" until a page succeeds
+INITIAL_PAGE_LIMIT = 500
+
+# Page limit override from AgentConfig.page_limit: skips limit discovery
+# (still reduced on "page limit exceeded"). None = discover.
+_page_limit_override: Optional[int] = None
+
+# (id(api), request class name) -> (working limit, smallest failed limit or 0, exact max found).
+# Reset at task start.
+_max_limit_cache = {}
+
+
+def set_page_limit_override(limit: Optional[int]) -> None:
+    """Set the starting page limit for all listings (None or 0 = discover it)."""
+    global _page_limit_override
+    _page_limit_override = limit or None
+
+
+def reset_page_limit_cache() -> None:
+    """Forget discovered page limits (call at task start)."""
+    _max_limit_cache.clear()
+
+
+def paginate_iter(
+    api: Any,
+    request_class: type,
+    items_field: str,
+    **request_kwargs
+) -> Iterator:
+    """
+    Iterate over all items with automatic pagination and limit discovery.
+
+    Automatically finds the maximum working page limit via binary search.
+    Handles "page limit exceeded" errors by reducing limit. The limit found
+    is cached per API client and request class, so later calls start at it
+    (AgentConfig.page_limit sets the starting limit directly).
+
+    Args:
+        api: ERC3 API client
+        request_class: Request class (e.g., dev.Req_ListProjects)
+        items_field: Name of list field in response ('projects', 'employees', etc.)
+        **request_kwargs: Other request params (e.g., query for search)
+
+    Yields:
+        Items page by page (pages are fetched as the iterator advances)
+
+    Raises:
+        ServerSystemError: If server pagination is completely broken
+    """
+    get_items = attrgetter(items_field)
+    cache_key = (id(api), request_class.__name__)
+    known = None if _page_limit_override else _max_limit_cache.get(cache_key)
+
+    offset = 0
+    if known:
+        # Resume the search of a previous call from its bounds
+        working_limit, failed_limit, limit_locked = known
+        current_limit = working_limit
+    else:
+        working_limit = 0  # Last known working limit
+        failed_limit = 0  # Smallest limit that got "page limit exceeded" (0 = none yet)
+        if _page_limit_override:
+            current_limit, limit_locked = _page_limit_override, True
+        else:
+            current_limit = INITIAL_PAGE_LIMIT  # Start high, halve on failure
+            limit_locked = False  # True when exact limit is found (no more exploration)
+
+    while True:
+        try:
+            request = request_class(offset=offset, limit=current_limit, **request_kwargs)
+            response = api.dispatch(request)
+            items = get_items(response) or []
+            yield from items
+
+            # Success — remember working limit
+            working_limit = current_limit
+
+            # If got less than requested — no more data
+            if len(items) < current_limit:
+                break
+
+            offset += len(items)
+
+            # Only try to increase limit if we haven't locked it yet
+            if not limit_locked:
+                if failed_limit:
+                    # Binary search up between working_limit and failed_limit
+                    current_limit = working_limit + (failed_limit - working_limit) // 2
+                    if current_limit <= working_limit:
+                        current_limit = working_limit
+                        limit_locked = True  # Converged on the exact max
+                else:
+                    current_limit = current_limit * 2
+
+        except ApiException as e:
+            error_msg = str(e.api_error.error) if hasattr(e, 'api_error') else str(e)
+            if "page limit exceeded" in error_msg.lower():
+                # If even limit=1 fails — server is broken
+                if current_limit == 1:
+                    raise ServerSystemError(SERVER_SYSTEM_ERROR)
+
+                failed_limit = current_limit
+                if working_limit >= failed_limit:
+                    working_limit = 0  # Cached working limit no longer works
+                    limit_locked = _page_limit_override is not None
+                if working_limit > 0:
+                    # Binary search down between working_limit and failed_limit
+                    current_limit = working_limit + (failed_limit - working_limit) // 2
+                    if current_limit <= working_limit:
+                        # Binary search converged
+                        current_limit = working_limit
+                        limit_locked = True
+                else:
+                    # Haven't found working limit yet — halve
+                    current_limit = max(1, current_limit // 2)
+            else:
+                raise  # Different error — propagate
+
+    if working_limit > 0:
+        _max_limit_cache[cache_key] = (working_limit, failed_limit, limit_locked)
+
+
+def paginate_all(
+    api: Any,
+    request_class: type,
+    items_field: str,
+    **request_kwargs
+) -> list:
+    """Fetch all items as a list (see paginate_iter)."""
+    return list(paginate_iter(api, request_class, items_field, **request_kwargs))
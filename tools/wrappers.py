@@ -1,10 +1,16 @@
 """Combo tool implementations - wrappers over erc3.erc3 (dev) API"""
 
+import heapq
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from operator import attrgetter, itemgetter
+from pathlib import Path
 from typing import Any, List, Optional
 
-from erc3 import erc3 as dev
+from erc3 import ApiException, erc3 as dev
 
-from infra import WIKI_ROOT, INDEX_ROOT
+from infra import WIKI_ROOT, INDEX_ROOT, TaskTerminated
 from .dtos import (
     Search_Wiki_With_Page, Resp_Search_Wiki_With_Page, WikiSearchResult,
     List_Wiki_Pages, Resp_List_Wiki_Pages,
@@ -30,8 +36,20 @@ from .dtos import (
     Rename_Wiki,
     # Batch employee fetch
     Get_Employees, Resp_Get_Employees,
+    # Employee update
+    Update_EmployeeInfo,
 )
-from tools.employee import EmployeeExtInfo, build_employee_ext_info
+from tools.employee import (
+    PROJECT_FETCH_WORKERS, EmployeeExtInfo, build_employee_ext_info,
+    get_employee_cached, get_project_cached, invalidate_employee,
+)
+from tools.pagination import SERVER_SYSTEM_ERROR, ServerSystemError, paginate_all, paginate_iter
+
+
+@lru_cache(maxsize=16)
+def _load_wiki_meta(meta_path: str, mtime_ns: int) -> str:
+    """Read a wiki _meta.txt; cached by path and modification time."""
+    return Path(meta_path).read_text(encoding="utf-8")
 
 
 def list_wiki_pages(wiki_sha: str) -> Resp_List_Wiki_Pages:
@@ -55,7 +73,7 @@ def list_wiki_pages(wiki_sha: str) -> Resp_List_Wiki_Pages:
         return Resp_List_Wiki_Pages(success=False, error=f"_meta.txt not found for wiki {wiki_sha}")
 
     try:
-        pages = meta_file.read_text(encoding="utf-8")
+        pages = _load_wiki_meta(str(meta_file), meta_file.stat().st_mtime_ns)
         return Resp_List_Wiki_Pages(success=True, pages=pages)
     except Exception as e:
         return Resp_List_Wiki_Pages(success=False, error=str(e))
@@ -84,7 +102,7 @@ def get_wiki_page(wiki_sha: str, request: Get_Wiki_Page) -> Resp_Get_Wiki_Page:
         )
 
     try:
-        content = page_path.read_text(encoding="utf-8")
+        content, _, _ = _read_wiki_page(page_path)
         return Resp_Get_Wiki_Page(success=True, content=content)
     except Exception as e:
         return Resp_Get_Wiki_Page(success=False, error=str(e))
@@ -112,27 +130,73 @@ def get_wiki_headers(request: Get_Wiki_Headers) -> Resp_Get_Wiki_Headers:
         )
 
     try:
-        content = page_path.read_text(encoding="utf-8")
-        headers = []
-        for line in content.splitlines():
-            stripped = line.strip()
-            # Match ##, ###, #### at start of line (not # which is title)
-            if stripped.startswith("## ") or stripped.startswith("### ") or stripped.startswith("#### "):
-                headers.append(stripped)
+        # ##, ###, #### at start of line (not # which is title)
+        _, header_positions, _ = _read_wiki_page(page_path)
+        headers = [header_text for _, header_text, _ in header_positions]
         return Resp_Get_Wiki_Headers(success=True, headers=headers)
     except Exception as e:
         return Resp_Get_Wiki_Headers(success=False, error=str(e))
 
 
+# Markdown header prefix -> level
+_LEVEL_BY_PREFIX = {"## ": 2, "### ": 3, "#### ": 4}
+
+
 def _get_header_level(header: str) -> int:
     """Get markdown header level (2 for ##, 3 for ###, 4 for ####)."""
-    if header.startswith("#### "):
-        return 4
-    elif header.startswith("### "):
-        return 3
-    elif header.startswith("## "):
-        return 2
-    return 0
+    get = _LEVEL_BY_PREFIX.get
+    return get(header[:5]) or get(header[:4]) or get(header[:3], 0)
+
+
+# Line breaks recognized by str.splitlines()
+_LINE_BREAKS = "\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029"
+_LINE_BREAK_RE = re.compile(rf"\r\n|[{_LINE_BREAKS}]")
+# Candidate header lines: optional indent, then ##, ### or #### and a space
+_HEADER_RE = re.compile(rf"(?:^|(?<=[{_LINE_BREAKS}]))[^\S{_LINE_BREAKS}]*#{{2,4}} ")
+
+
+@lru_cache(maxsize=256)
+def _load_wiki_page(page_path: str, mtime_ns: int) -> tuple:
+    """Read and parse a wiki page; cached by path and modification time.
+
+    Returns:
+        (content, header_positions, section_index) where header_positions is
+        ((offset, header_text, level), ...) with offset = start of the header
+        line in content, and section_index maps header text (first occurrence)
+        to the (start, end) offsets of its section
+    """
+    content = Path(page_path).read_text(encoding="utf-8")
+
+    # Build index of all headers with their line offsets
+    header_positions = []  # [(offset, header_text, level), ...]
+    for m in _HEADER_RE.finditer(content):
+        start = m.start()
+        line_end = _LINE_BREAK_RE.search(content, start)
+        stripped = content[start:line_end.start() if line_end else len(content)].strip()
+        level = _get_header_level(stripped)
+        if level > 0:
+            header_positions.append((start, stripped, level))
+
+    # Section end = next header of same or higher level (lower number).
+    # Walk backwards, tracking the nearest following header per level.
+    next_offset = {2: len(content), 3: len(content), 4: len(content)}
+    section_ends = [0] * len(header_positions)
+    for idx in range(len(header_positions) - 1, -1, -1):
+        start, _, level = header_positions[idx]
+        section_ends[idx] = min(next_offset[lvl] for lvl in range(2, level + 1))
+        next_offset[level] = start
+
+    # Header text -> (start, end) of its section (first occurrence wins)
+    section_index = {}
+    for (start, header_text, _), end in zip(header_positions, section_ends):
+        section_index.setdefault(header_text, (start, end))
+
+    return content, tuple(header_positions), section_index
+
+
+def _read_wiki_page(page_path: Path) -> tuple:
+    """Get parsed wiki page via _load_wiki_page (re-read when the file changes)."""
+    return _load_wiki_page(str(page_path), page_path.stat().st_mtime_ns)
 
 
 def get_wiki_fragments(request: Get_Wiki_Fragments) -> Resp_Get_Wiki_Fragments:
@@ -162,16 +226,7 @@ def get_wiki_fragments(request: Get_Wiki_Fragments) -> Resp_Get_Wiki_Fragments:
         )
 
     try:
-        content = page_path.read_text(encoding="utf-8")
-        lines = content.splitlines()
-
-        # Build index of all headers with their line numbers
-        header_positions = []  # [(line_num, header_text, level), ...]
-        for i, line in enumerate(lines):
-            stripped = line.strip()
-            level = _get_header_level(stripped)
-            if level > 0:
-                header_positions.append((i, stripped, level))
+        content, _, section_index = _read_wiki_page(page_path)
 
         fragments = []
 
@@ -187,33 +242,19 @@ def get_wiki_fragments(request: Get_Wiki_Fragments) -> Resp_Get_Wiki_Fragments:
                 ))
                 continue
 
-            # Find this header in positions
-            start_line = None
-            start_idx = None
-            for idx, (line_num, header_text, level) in enumerate(header_positions):
-                if header_text == requested_header_stripped:
-                    start_line = line_num
-                    start_idx = idx
-                    break
+            # Find this header's section
+            section = section_index.get(requested_header_stripped)
 
-            if start_line is None:
+            if section is None:
                 fragments.append(WikiFragment(
                     header=requested_header,
                     content=f"[Header not found: {requested_header}]"
                 ))
                 continue
-
-            # Find end: next header of same or higher level (lower number)
-            end_line = len(lines)  # default to end of file
-            for next_idx in range(start_idx + 1, len(header_positions)):
-                _, _, next_level = header_positions[next_idx]
-                if next_level <= requested_level:
-                    end_line = header_positions[next_idx][0]
-                    break
+            start, end = section
 
             # Extract content (including the header line itself)
-            fragment_lines = lines[start_line:end_line]
-            fragment_content = "\n".join(fragment_lines).strip()
+            fragment_content = content[start:end].strip()
 
             fragments.append(WikiFragment(
                 header=requested_header_stripped,
@@ -226,96 +267,6 @@ def get_wiki_fragments(request: Get_Wiki_Fragments) -> Resp_Get_Wiki_Fragments:
         return Resp_Get_Wiki_Fragments(success=False, error=str(e))
 
 
-# =============================================================================
-# Pagination helper
-# =============================================================================
-
-# Error message when server pagination is completely broken (max_limit = -1)
-# IMPORTANT: This message must clearly indicate SERVER ERROR so agent uses 'server_error' outcome
-SERVER_SYSTEM_ERROR = "SERVER ERROR: The server API is broken and not responding correctly. Use outcome 'server_error' when reporting this."
-
-
-class ServerSystemError(Exception):
-    """Raised when server API is broken (e.g., pagination disabled)."""
-    pass
-
-
-def paginate_all(
-    api: Any,
-    request_class: type,
-    items_field: str,
-    **request_kwargs
-) -> list:
-    """
-    Fetch all items with automatic pagination and limit discovery.
-
-    Automatically finds the maximum working page limit via binary search.
-    Handles "page limit exceeded" errors by reducing limit.
-
-    Args:
-        api: ERC3 API client
-        request_class: Request class (e.g., dev.Req_ListProjects)
-        items_field: Name of list field in response ('projects', 'employees', etc.)
-        **request_kwargs: Other request params (e.g., query for search)
-
-    Returns:
-        Complete list of all items
-
-    Raises:
-        ServerSystemError: If server pagination is completely broken
-    """
-    from erc3 import ApiException
-
-    all_items = []
-    offset = 0
-    working_limit = 0  # Last known working limit
-    current_limit = 2  # Start small
-    limit_locked = False  # True when exact limit is found (no more exploration)
-
-    while True:
-        try:
-            request = request_class(offset=offset, limit=current_limit, **request_kwargs)
-            response = api.dispatch(request)
-            items = getattr(response, items_field) or []
-            all_items.extend(items)
-
-            # Success — remember working limit
-            working_limit = current_limit
-
-            # If got less than requested — no more data
-            if len(items) < current_limit:
-                break
-
-            offset += len(items)
-
-            # Only try to increase limit if we haven't locked it yet
-            if not limit_locked:
-                current_limit = current_limit * 2
-
-        except ApiException as e:
-            error_msg = str(e.api_error.error) if hasattr(e, 'api_error') else str(e)
-            if "page limit exceeded" in error_msg.lower():
-                # If even limit=1 fails — server is broken
-                if current_limit == 1:
-                    raise ServerSystemError(SERVER_SYSTEM_ERROR)
-
-                if working_limit > 0:
-                    # We hit the limit — lock it, no more exploration
-                    limit_locked = True
-                    # Binary search between working_limit and current_limit
-                    current_limit = working_limit + (current_limit - working_limit) // 2
-                    if current_limit <= working_limit:
-                        # Binary search converged
-                        current_limit = working_limit
-                else:
-                    # Haven't found working limit yet — halve
-                    current_limit = max(1, current_limit // 2)
-            else:
-                raise  # Different error — propagate
-
-    return all_items
-
-
 # =============================================================================
 # Pagination wrappers - hide pagination from LLM
 # =============================================================================
@@ -375,17 +326,15 @@ def search_projects(api: Any, request: Req_SearchProjects) -> Resp_SearchProject
             )
 
         # Fetch all projects (with team filter, but without query - we filter locally)
-        all_projects = paginate_all(api, dev.Req_SearchProjects, 'projects', **kwargs)
-
-        # Filter locally: search substring in id and name (case-insensitive)
-        query_lower = request.name_or_id_substring.lower() if request.name_or_id_substring else ""
-        if query_lower:
-            filtered = [
-                p for p in all_projects
-                if query_lower in p.id.lower() or query_lower in p.name.lower()
-            ]
+        all_projects = paginate_iter(api, dev.Req_SearchProjects, 'projects', **kwargs)
+
+        # Filter locally page by page: search substring in id and name
+        # (case-insensitive, no lowercased copy of every id/name)
+        if request.name_or_id_substring:
+            search = re.compile(re.escape(request.name_or_id_substring), re.IGNORECASE).search
+            filtered = [p for p in all_projects if search(p.id) or search(p.name)]
         else:
-            filtered = all_projects
+            filtered = list(all_projects)
 
         return Resp_SearchProjects(success=True, projects=filtered)
     except ServerSystemError as e:
@@ -402,17 +351,18 @@ SKILL_LEVEL_SCALE = {
 }
 
 
+# Level name -> (min_level, max_level)
+_LEVEL_RANGES = {name: (min(levels), max(levels)) for name, levels in SKILL_LEVEL_SCALE.items()}
+
+
 def _levels_to_range(names: Optional[List[str]]) -> tuple:
     """Convert level names to (min_level, max_level) range. Returns (1, 10) if None."""
     if not names:
         return (1, 10)
-    all_levels = []
-    for name in names:
-        if name in SKILL_LEVEL_SCALE:
-            all_levels.extend(SKILL_LEVEL_SCALE[name])
-    if not all_levels:
+    ranges = [_LEVEL_RANGES[name] for name in names if name in _LEVEL_RANGES]
+    if not ranges:
         return (1, 10)  # fallback to all levels
-    return (min(all_levels), max(all_levels))
+    return (min(lo for lo, _ in ranges), max(hi for _, hi in ranges))
 
 
 def _get_criterion_mode(c: Optional[Criterion]) -> str:
@@ -422,12 +372,16 @@ def _get_criterion_mode(c: Optional[Criterion]) -> str:
     return c.mode
 
 
+# MOST/LEAST level probes sent at a time (stops after the first batch with a match)
+LEVEL_PROBE_BATCH = 3
+
+
 def search_employees(api: Any, request: Req_SearchEmployees) -> Resp_SearchEmployees:
     """Search employees with filtering and optional sorting.
 
     Modes:
-    - MOST: Iterative search 10→1, returns all tied for best level
-    - LEAST: Iterative search 1→10, returns all tied for worst level
+    - MOST: Level probes 10→1 (run concurrently), returns all tied for best level
+    - LEAST: Level probes 1→10 (run concurrently), returns all tied for worst level
     - SPECIFIC: Filter by specified levels, returns all matching
     - NONE: No skill/will filter, just base filters
     """
@@ -469,54 +423,49 @@ def search_employees(api: Any, request: Req_SearchEmployees) -> Resp_SearchEmplo
 
         # --- STRATEGY A: Iterative search (MOST or LEAST) ---
         if primary_mode in ("MOST", "LEAST"):
-            # Determine iteration range
+            # MOST: 10→1, LEAST: 1→10
+            levels_to_check = range(10, 0, -1) if primary_mode == "MOST" else range(1, 11)
+
+            # Primary: fixed level per probe. Secondary: its range (SPECIFIC)
+            # or wide (MOST/LEAST) - the same filter for every probe
             if is_skill_primary:
-                start, end = 1, 10
+                primary, primary_key = request.skill, 'skills'
+                secondary, secondary_key, secondary_range = request.will, 'wills', will_range
             else:
-                start, end = 1, 10
+                primary, primary_key = request.will, 'wills'
+                secondary, secondary_key, secondary_range = request.skill, 'skills', skill_range
+
+            probe_kwargs = base_kwargs.copy()
+            if secondary:
+                min_l, max_l = secondary_range
+                probe_kwargs[secondary_key] = [dev.SkillFilter(
+                    name=secondary.name, min_level=min_l, max_level=max_l
+                )]
 
-            # MOST: 10→1, LEAST: 1→10
-            levels_to_check = range(10, 0, -1) if primary_mode == "MOST" else range(1, 11)
+            def level_kwargs(level: int) -> dict:
+                return {**probe_kwargs, primary_key: [dev.SkillFilter(
+                    name=primary.name, min_level=level, max_level=level
+                )]}
 
+            # Search briefs carry no levels, so probe each level - a few at once,
+            # taking the first non-empty one in iteration order
             found_brief = []
-
-            for level in levels_to_check:
-                kwargs = base_kwargs.copy()
-
-                # Build SKILL filter
-                if request.skill:
-                    if is_skill_primary:
-                        # Primary: fixed level
-                        kwargs['skills'] = [dev.SkillFilter(
-                            name=request.skill.name, min_level=level, max_level=level
-                        )]
-                    else:
-                        # Secondary: use its range (CERTAIN) or wide (MOST/LEAST)
-                        min_l, max_l = skill_range
-                        kwargs['skills'] = [dev.SkillFilter(
-                            name=request.skill.name, min_level=min_l, max_level=max_l
-                        )]
-
-                # Build WILL filter
-                if request.will:
-                    if not is_skill_primary:
-                        # Primary: fixed level
-                        kwargs['wills'] = [dev.SkillFilter(
-                            name=request.will.name, min_level=level, max_level=level
-                        )]
-                    else:
-                        # Secondary: use its range (CERTAIN) or wide (MOST/LEAST)
-                        min_l, max_l = will_range
-                        kwargs['wills'] = [dev.SkillFilter(
-                            name=request.will.name, min_level=min_l, max_level=max_l
-                        )]
-
-                # Query API
-                batch = paginate_all(api, dev.Req_SearchEmployees, 'employees', **kwargs)
-
-                if batch:
-                    found_brief.extend(batch)
-                    # Stop at first found level (all ties for best/worst)
+            for start in range(0, len(levels_to_check), LEVEL_PROBE_BATCH):
+                futures = [
+                    _EMP_EXEC.submit(paginate_all, api, dev.Req_SearchEmployees, 'employees', **level_kwargs(level))
+                    for level in levels_to_check[start:start + LEVEL_PROBE_BATCH]
+                ]
+                try:
+                    for future in futures:
+                        batch = future.result()
+                        if batch:
+                            found_brief.extend(batch)
+                            # Stop at first found level (all ties for best/worst)
+                            break
+                finally:
+                    for future in futures:
+                        future.cancel()
+                if found_brief:
                     break
 
             # MOST/LEAST: return EmployeeBrief (no need for full profile)
@@ -547,12 +496,13 @@ def search_employees(api: Any, request: Req_SearchEmployees) -> Resp_SearchEmplo
                 filter_skills = {request.skill.name} if request.skill else set()
                 filter_wills = {request.will.name} if request.will else set()
 
+                # Fetch full profiles concurrently, keep search order
                 found_filtered = []
-                for brief in employees:
+                futures = [_EMP_EXEC.submit(get_employee_cached, api, brief.id) for brief in employees]
+                for future in futures:
                     try:
-                        resp = api.dispatch(dev.Req_GetEmployee(id=brief.id))
-                        if resp and resp.employee:
-                            emp = resp.employee
+                        emp = future.result()
+                        if emp:
                             # Filter skills/wills to only those in filter
                             filtered_skills = [s for s in emp.skills if s.name in filter_skills]
                             filtered_wills = [w for w in emp.wills if w.name in filter_wills]
@@ -580,15 +530,18 @@ def search_employees(api: Any, request: Req_SearchEmployees) -> Resp_SearchEmplo
         return Resp_SearchEmployees(success=False, error_message=str(e))
 
 
+# Word "project" in customer queries (case-insensitive)
+_PROJECT_RE = re.compile(r'\bproject\b', re.IGNORECASE)
+
+
 def search_customers(api: Any, request: Req_SearchCustomers) -> Resp_SearchCustomers:
     """Search customers with automatic pagination."""
     try:
-        import re
         kwargs = {}
 
         # Remove "project" from query (case-insensitive)
         if request.name_or_id_substring:
-            query = re.sub(r'\bproject\b', '', request.name_or_id_substring, flags=re.IGNORECASE).strip()
+            query = _PROJECT_RE.sub('', request.name_or_id_substring).strip()
             query = ' '.join(query.split())  # normalize whitespace
             if query:
                 kwargs['query'] = query
@@ -664,9 +617,9 @@ def get_project(api: Any, request: Get_Project) -> Resp_GetProject:
         Resp_GetProject with project details or error message
     """
     try:
-        result = api.dispatch(dev.Req_GetProject(id=request.project_id))
-        if result and result.project:
-            return Resp_GetProject(project=_convert_project(result.project), found=True)
+        project = get_project_cached(api, request.project_id)
+        if project:
+            return Resp_GetProject(project=_convert_project(project), found=True)
     except Exception:
         pass
     return Resp_GetProject(found=False, message="Project not found")
@@ -676,6 +629,10 @@ def get_project(api: Any, request: Get_Project) -> Resp_GetProject:
 # Batch employee fetch
 # =============================================================================
 
+# Shared pool for per-employee API fetches and search_employees probes (I/O-bound)
+_EMP_EXEC = ThreadPoolExecutor(max_workers=16, thread_name_prefix="emp")
+
+
 def get_employees(
     api: Any,
     request: Get_Employees,
@@ -687,8 +644,9 @@ def get_employees(
     """
     Fetch multiple employees by IDs with optional field selection.
 
-    Uses build_employee_ext_info() for each employee. Filters fields if
-    include_fields is specified. Sorts by requested field.
+    Uses build_employee_ext_info() for each employee, run concurrently on
+    _EMP_EXEC. Filters fields if include_fields is specified. Sorts by
+    requested field.
 
     Args:
         api: ERC3 API client
@@ -701,8 +659,6 @@ def get_employees(
     Returns:
         Resp_Get_Employees with list of employees
     """
-    from infra import TaskTerminated
-
     employees = []
     errors = []
 
@@ -711,40 +667,45 @@ def get_employees(
         request.include_fields is None or "projects" in request.include_fields
     )
 
+    # Fetch each distinct employee once, concurrently; collect in requested
+    # order (duplicated IDs repeat the same result)
+    fetch = partial(
+        build_employee_ext_info,
+        api,
+        include_projects=include_projects,
+        store_api=store_api,
+        log_file=log_file,
+        core=core,
+        task=task,
+    )
+    futures = {emp_id: _EMP_EXEC.submit(fetch, emp_id) for emp_id in dict.fromkeys(request.employee_ids)}
     for emp_id in request.employee_ids:
         try:
-            emp_info = build_employee_ext_info(
-                api=api,
-                employee_id=emp_id,
-                include_projects=include_projects,
-                store_api=store_api,
-                log_file=log_file,
-                core=core,
-                task=task,
-            )
-            employees.append(emp_info)
+            employees.append(futures[emp_id].result())
         except TaskTerminated:
-            raise  # Server error - propagate
+            # Server error - drop fetches that have not started yet, propagate
+            for pending in futures.values():
+                pending.cancel()
+            raise
         except Exception as e:
             errors.append(f"{emp_id}: {str(e)}")
 
     # Filter fields if specified
     if request.include_fields is not None:
         fields_to_keep = set(request.include_fields) | {"id", "notes"}  # id and notes always included
-        filtered = []
-        for emp in employees:
-            data = emp.model_dump()
-            filtered_data = {k: v for k, v in data.items() if k in fields_to_keep}
-            filtered.append(EmployeeExtInfo(**filtered_data))
-        employees = filtered
+        fields_to_keep &= EmployeeExtInfo.model_fields.keys()
+        # Copy kept attributes as-is (already validated), no dump/re-validate round-trip
+        construct = EmployeeExtInfo.model_construct
+        employees = [
+            construct(**{k: getattr(emp, k) for k in fields_to_keep})
+            for emp in employees
+        ]
 
     # Sort if requested
     if request.sort_by and employees:
         reverse = request.sort_order == "desc"
-        employees.sort(
-            key=lambda e: getattr(e, request.sort_by, "") or "",
-            reverse=reverse
-        )
+        sort_value = attrgetter(request.sort_by)  # sort_by is a Literal of EmployeeExtInfo fields
+        employees.sort(key=lambda e: sort_value(e) or "", reverse=reverse)
 
     return Resp_Get_Employees(
         employees=employees,
@@ -757,9 +718,14 @@ def get_employees(
 # Employee update wrapper
 # =============================================================================
 
+# Fields merged by update_employee_info (null in request = keep current value)
+_EMP_UPDATE_FIELDS = ("notes", "salary", "skills", "wills", "location", "department")
+_EMP_LIST_FIELDS = ("skills", "wills")  # missing current value is sent as []
+
+
 def update_employee_info(api: Any, request: Any) -> Any:
     """
-    PATCH-style employee update: fetch current data, merge with changes.
+    PATCH-style employee update: merge changes into current data.
 
     Convention:
     - null = keep current value
@@ -772,27 +738,28 @@ def update_employee_info(api: Any, request: Any) -> Any:
     Returns:
         Resp_UpdateEmployeeInfo from API
     """
-    from erc3 import erc3 as dev
-
-    # 1. Fetch current employee data
-    current = api.dispatch(dev.Req_GetEmployee(id=request.employee))
-    emp = current.employee
-
-    # 2. Merge helper: null = keep current, any value = use new
-    def merge(new_val, current_val):
-        return current_val if new_val is None else new_val
+    # 1. Current employee data - from the per-task cache when this employee
+    # was already read (the cache entry is dropped after every update)
+    emp = get_employee_cached(api, request.employee)
+
+    # 2. Merge: null = keep current, any value = use new
+    # (current skill/will lists are passed as is - request validation copies them)
+    merged = {}
+    for field in _EMP_UPDATE_FIELDS:
+        value = getattr(request, field)
+        merged[field] = getattr(emp, field) if value is None else value
+    for field in _EMP_LIST_FIELDS:
+        if merged[field] is None:
+            merged[field] = []
 
     # 3. Build full request with merged values
-    return api.dispatch(dev.Req_UpdateEmployeeInfo(
+    result = api.dispatch(dev.Req_UpdateEmployeeInfo(
         employee=request.employee,
-        notes=merge(request.notes, emp.notes),
-        salary=merge(request.salary, emp.salary),
-        skills=merge(request.skills, list(emp.skills) if emp.skills else []),
-        wills=merge(request.wills, list(emp.wills) if emp.wills else []),
-        location=merge(request.location, emp.location),
-        department=merge(request.department, emp.department),
         changed_by=request.changed_by,
+        **merged,
     ))
+    invalidate_employee(request.employee)
+    return result
 
 
 def batch_update_employees(api: Any, request: Any) -> dict:
@@ -806,10 +773,7 @@ def batch_update_employees(api: Any, request: Any) -> dict:
     Returns:
         Dict with results for each employee
     """
-    from .dtos import Update_EmployeeInfo
-
-    results = []
-    for upd in request.updates:
+    def update(upd) -> None:
         # Build single update request
         single_request = Update_EmployeeInfo(
             employee=upd.employee,
@@ -821,13 +785,30 @@ def batch_update_employees(api: Any, request: Any) -> dict:
             department=upd.department,
             changed_by=request.changed_by,
         )
+        update_employee_info(api, single_request)
+
+    # Different employees: update concurrently. Repeated employees keep the
+    # serial order (each update merges into the previous one).
+    employees = [upd.employee for upd in request.updates]
+    if len(set(employees)) == len(employees):
+        outcomes = [(upd, _EMP_EXEC.submit(update, upd)) for upd in request.updates]
+    else:
+        outcomes = [(upd, None) for upd in request.updates]
+
+    results = []
+    success_count = 0
+    for upd, future in outcomes:
         try:
-            update_employee_info(api, single_request)
+            if future is not None:
+                future.result()
+            else:
+                update(upd)
             results.append({"employee": upd.employee, "success": True})
+            success_count += 1
         except Exception as e:
             results.append({"employee": upd.employee, "success": False, "error": str(e)})
 
-    return {"updated": len([r for r in results if r["success"]]), "results": results}
+    return {"updated": success_count, "results": results}
 
 
 def update_time_entry(api: Any, request: Update_TimeEntry) -> Any:
@@ -866,6 +847,29 @@ def update_time_entry(api: Any, request: Update_TimeEntry) -> Any:
     ))
 
 
+# Wiki listing per API client: id(api) -> (paths, {basename: [paths...]}).
+# Dropped on every wiki write and at task start.
+_wiki_paths_cache = {}
+
+
+def invalidate_wiki_paths() -> None:
+    """Forget cached wiki listings (call after any wiki write and at task start)."""
+    _wiki_paths_cache.clear()
+
+
+def _wiki_paths_by_basename(api: Any) -> tuple:
+    """ListWiki through the cache. Returns (paths, basename -> paths in listing order)."""
+    key = id(api)
+    cached = _wiki_paths_cache.get(key)
+    if cached is None:
+        paths = api.dispatch(dev.Req_ListWiki()).paths or []
+        by_basename = {}
+        for p in paths:
+            by_basename.setdefault(p.rsplit('/', 1)[-1], []).append(p)
+        cached = _wiki_paths_cache[key] = (paths, by_basename)
+    return cached
+
+
 def delete_wiki(api: Any, file: str, changed_by: str) -> dict:
     """Delete wiki article by setting content to empty string.
 
@@ -875,16 +879,13 @@ def delete_wiki(api: Any, file: str, changed_by: str) -> dict:
 
     Returns recoverable error (success=False, needs_clarification=True) if ambiguous.
     """
-    from erc3 import ApiException
-
     # If path is root-level (no '/'), validate uniqueness
     if '/' not in file:
         try:
-            wiki_list = api.dispatch(dev.Req_ListWiki())
-            paths = wiki_list.paths or []
+            paths, by_basename = _wiki_paths_by_basename(api)
 
-            # Find all paths ending with this filename
-            matches = [p for p in paths if p == file or p.endswith('/' + file)]
+            # All paths with this file name (root-level or in any folder)
+            matches = by_basename.get(file, [])
 
             if len(matches) == 0:
                 return {
@@ -913,6 +914,8 @@ def delete_wiki(api: Any, file: str, changed_by: str) -> dict:
         return {"success": True, "deleted": file}
     except ApiException as e:
         return {"success": False, "error": str(e.api_error)}
+    finally:
+        invalidate_wiki_paths()
 
 
 def search_wiki(wiki_sha: str, request: Search_Wiki_With_Page) -> Resp_Search_Wiki_With_Page:
@@ -933,34 +936,41 @@ def search_wiki(wiki_sha: str, request: Search_Wiki_With_Page) -> Resp_Search_Wi
         return Resp_Search_Wiki_With_Page(success=False, error="wiki_sha not available")
 
     try:
-        from infra.wiki_rag import search as wiki_search
+        from infra.wiki_rag import search_many as wiki_search_many
 
         # Normalize query to list
         queries = request.query if isinstance(request.query, list) else [request.query]
 
-        # Collect results from all queries
-        all_results = {}  # key: (file_path, section_title, text) -> WikiSearchResult
-        for q in queries:
-            raw_results = wiki_search(wiki_sha, q, request.top_k)
+        # Collect results from all queries (one batched index search)
+        all_results = {}  # key: (file_path, section_title, text) -> best score
+        for raw_results in wiki_search_many(wiki_sha, queries, request.top_k):
             for r in raw_results:
                 key = (r.get("file_path", ""), r.get("section_title", ""), r.get("text", ""))
                 score = r.get("score", 0.0)
                 # Keep highest score for duplicates
-                if key not in all_results or all_results[key].score < score:
-                    all_results[key] = WikiSearchResult(
-                        score=score,
-                        page_file_name=r.get("file_path", ""),
-                        section_title=r.get("section_title", ""),
-                        text=r.get("text", ""),
-                    )
-
-        # Sort by score descending and take top_k
-        results = sorted(all_results.values(), key=lambda x: x.score, reverse=True)[:request.top_k]
+                best = all_results.get(key)
+                if best is None or best < score:
+                    all_results[key] = score
+
+        # Take top_k by score descending (same order as a stable full sort);
+        # result objects are built for these only
+        top = heapq.nlargest(request.top_k, all_results.items(), key=itemgetter(1))
+        results = [
+            WikiSearchResult(score=score, page_file_name=fp, section_title=st, text=text)
+            for (fp, st, text), score in top
+        ]
         return Resp_Search_Wiki_With_Page(success=True, results=results)
     except Exception as e:
         return Resp_Search_Wiki_With_Page(success=False, error=str(e))
 
 
+# Project status filter per workload scope
+_SCOPE_STATUSES = {
+    WorkloadScope.active_only: ["active"],
+    WorkloadScope.total_allocation: ["active", "exploring", "paused", "idea", "archived"],  # all statuses
+}
+
+
 def get_employees_workload(api: Any, request: Get_Employees_Workload) -> Resp_Get_Employees_Workload:
     """
     Get workload (FTE) for one or more employees.
@@ -978,35 +988,47 @@ def get_employees_workload(api: Any, request: Get_Employees_Workload) -> Resp_Ge
     Returns:
         Resp_Get_Employees_Workload with workload for each employee
     """
-    # Determine status filter based on scope
-    if request.workload_scope == WorkloadScope.active_only:
-        status_filter = ["active"]
-    else:  # total_allocation - all statuses
-        status_filter = ["active", "exploring", "paused", "idea", "archived"]
+    status_filter = _SCOPE_STATUSES[request.workload_scope]
     results = []
+    team_slices = {}  # project_id -> {employee_id: time_slice}, built once per project
+
+    with ThreadPoolExecutor(max_workers=PROJECT_FETCH_WORKERS) as ex:
+        def fetch_projects(emp_id: str) -> list:
+            # Search current projects with employee in team
+            projects = paginate_iter(
+                api, dev.Req_SearchProjects, 'projects',
+                status=status_filter,
+                team=dev.ProjectTeamFilter(employee_id=emp_id)
+            )
+            # Get all project details concurrently (submitted as listing pages arrive)
+            return [ex.submit(get_project_cached, api, proj.id) for proj in projects]
 
-    for emp_id in request.employee_ids:
-        # Search current projects with employee in team
-        projects = paginate_all(
-            api, dev.Req_SearchProjects, 'projects',
-            status=status_filter,
-            team=dev.ProjectTeamFilter(employee_id=emp_id)
-        )
-
-        # For each project, get details and find time_slice
-        total_fte = 0.0
-        for proj in projects:
-            try:
-                resp = api.dispatch(dev.Req_GetProject(id=proj.id))
-                if resp.project:
-                    for wl in resp.project.team:
-                        if wl.employee == emp_id:
-                            total_fte += wl.time_slice
-                            break
-            except Exception:
-                pass  # Skip projects that fail to load
+        # Listings of different employees are independent: run them concurrently
+        listings = [_EMP_EXEC.submit(fetch_projects, emp_id) for emp_id in request.employee_ids]
+        try:
+            for emp_id, listing in zip(request.employee_ids, listings):
+                # Find time_slice in each project (summed in list order)
+                futures = listing.result()
+                total_fte = 0.0
+                for future in futures:
+                    try:
+                        project = future.result()
+                        if project:
+                            slices = team_slices.get(project.id)
+                            if slices is None:
+                                slices = team_slices[project.id] = {}
+                                for wl in project.team:
+                                    slices.setdefault(wl.employee, wl.time_slice)  # first entry wins
+                            time_slice = slices.get(emp_id)
+                            if time_slice is not None:
+                                total_fte += time_slice
+                    except Exception:
+                        pass  # Skip projects that fail to load
 
-        results.append(EmployeeWorkload(employee_id=emp_id, total_fte=round(total_fte, 2)))
+                results.append(EmployeeWorkload(employee_id=emp_id, total_fte=round(total_fte, 2)))
+        finally:
+            for listing in listings:
+                listing.cancel()  # Not started yet (listing of an earlier employee failed)
 
     return Resp_Get_Employees_Workload(workloads=results)
 
@@ -1016,7 +1038,7 @@ def get_project_leads(api: Any) -> Resp_Get_Project_Leads:
     Get all unique project leads across all projects.
 
     Algorithm:
-    1. List all projects
+    1. Search projects that have a team member with role='Lead' (all statuses)
     2. For each project, find team member with role='Lead'
     3. Collect unique employee IDs
 
@@ -1026,20 +1048,27 @@ def get_project_leads(api: Any) -> Resp_Get_Project_Leads:
     Returns:
         Resp_Get_Project_Leads with list of unique lead employee IDs
     """
-    # 1. Get all projects
-    projects = paginate_all(api, dev.Req_ListProjects, 'projects')
+    # 1. Get projects with a Lead (filtered server-side, streamed page by page)
+    projects = paginate_iter(
+        api, dev.Req_SearchProjects, 'projects',
+        include_archived=True,
+        team=dev.ProjectTeamFilter(role="Lead")
+    )
 
-    # 2. Collect unique leads
+    # 2. Collect unique leads (project details fetched concurrently,
+    #    prefetched while the listing is still paging)
     leads = set()
-    for proj in projects:
-        try:
-            resp = api.dispatch(dev.Req_GetProject(id=proj.id))
-            if resp.project:
-                for wl in resp.project.team:
-                    if wl.role == "Lead":
-                        leads.add(wl.employee)
-        except Exception:
-            pass  # Skip projects that fail to load
+    with ThreadPoolExecutor(max_workers=PROJECT_FETCH_WORKERS) as ex:
+        futures = [ex.submit(get_project_cached, api, proj.id) for proj in projects]
+        for future in futures:
+            try:
+                project = future.result()
+                if project:
+                    for wl in project.team:
+                        if wl.role == "Lead":
+                            leads.add(wl.employee)
+            except Exception:
+                pass  # Skip projects that fail to load
 
     return Resp_Get_Project_Leads(leads=sorted(leads))
 
@@ -1049,9 +1078,12 @@ def rename_wiki(api: Any, request: Rename_Wiki) -> dict:
     Rename/move a wiki page.
 
     No direct rename API exists. This function:
-    1. Loads content from old path
+    1. Loads content from old path (and current content at new path)
     2. Creates new file with that content
     3. Zeros out the old file
+    Steps run in this order, so the content always exists somewhere. Writes
+    start only after both loads succeeded; if step 3 fails, the new path is
+    restored to its loaded content (rollback).
 
     Args:
         api: ERC3 API client
@@ -1060,40 +1092,77 @@ def rename_wiki(api: Any, request: Rename_Wiki) -> dict:
     Returns:
         dict with success status and message
     """
-    # 1. Load old file content
-    try:
-        old_content_resp = api.dispatch(dev.Req_LoadWiki(file=request.old_path))
-        content = old_content_resp.content
-    except Exception as e:
-        return {"success": False, "error": f"Failed to load {request.old_path}: {str(e)}"}
+    if request.new_path == request.old_path:
+        return {"success": True, "message": f"{request.old_path} already has this name"}
 
-    # 2. Create new file with content
-    try:
+    def load_or_empty(path: str) -> str:
+        try:
+            return api.dispatch(dev.Req_LoadWiki(file=path)).content or ""
+        except ApiException as e:
+            status = getattr(e.api_error, 'status', 500) if hasattr(e, 'api_error') else 500
+            if status == 404:
+                return ""  # Missing page
+            raise
+
+    def write(path: str, text: str) -> None:
         api.dispatch(dev.Req_UpdateWiki(
-            file=request.new_path,
-            content=content,
+            file=path,
+            content=text,
             changed_by=request.changed_by,
         ))
+
+    # 1. Load old file content; current new path content is loaded alongside
+    # (kept to roll back step 2 - nothing is written unless both loads succeed)
+    with ThreadPoolExecutor(max_workers=1) as ex:
+        previous_future = ex.submit(load_or_empty, request.new_path)
+        try:
+            old_content_resp = api.dispatch(dev.Req_LoadWiki(file=request.old_path))
+            content = old_content_resp.content
+        except Exception as e:
+            return {"success": False, "error": f"Failed to load {request.old_path}: {str(e)}"}
+        try:
+            previous = previous_future.result()
+        except Exception as e:
+            return {"success": False, "error": f"Failed to load {request.new_path}: {str(e)}"}
+
+    # Nothing to move: writing "" to the new path would only wipe it
+    if not content:
+        return {"success": False, "error": f"Nothing to rename: {request.old_path} is empty or missing"}
+
+    # Steps 2-3 change the wiki listing
+    invalidate_wiki_paths()
+
+    # 2. Create new file with content
+    try:
+        write(request.new_path, content)
     except Exception as e:
         return {"success": False, "error": f"Failed to create {request.new_path}: {str(e)}"}
 
-    # 3. Zero out old file
+    # 3. Zero out old file (only after the new file exists, so content is never lost)
     try:
-        api.dispatch(dev.Req_UpdateWiki(
-            file=request.old_path,
-            content="",
-            changed_by=request.changed_by,
-        ))
+        write(request.old_path, "")
     except Exception as e:
+        # Roll back step 2 so the wiki is left as before the rename
+        try:
+            write(request.new_path, previous)
+        except Exception:
+            return {
+                "success": False,
+                "error": f"Created {request.new_path} but failed to zero out {request.old_path}: {str(e)}",
+                "partial": True,
+            }
         return {
             "success": False,
-            "error": f"Created {request.new_path} but failed to zero out {request.old_path}: {str(e)}",
-            "partial": True,
+            "error": f"Failed to zero out {request.old_path}: {str(e)}. Rename rolled back, wiki unchanged",
         }
 
     return {"success": True, "message": f"Renamed {request.old_path} -> {request.new_path}"}
 
 
+# Max concurrent UpdateWiki requests in create_wiki_pages
+WIKI_WRITE_WORKERS = 8
+
+
 def create_wiki_pages(api: Any, request) -> dict:
     """
     Create multiple wiki pages at once.
@@ -1108,17 +1177,34 @@ def create_wiki_pages(api: Any, request) -> dict:
     created = []
     failed = []
 
-    for page in request.pages:
-        try:
-            api.dispatch(dev.Req_UpdateWiki(
-                file=page.file,
-                content=page.content,
-                changed_by=request.changed_by,
-            ))
-            created.append(page.file)
-        except Exception as e:
-            failed.append({"file": page.file, "error": str(e)})
+    def write(page) -> None:
+        api.dispatch(dev.Req_UpdateWiki(
+            file=page.file,
+            content=page.content,
+            changed_by=request.changed_by,
+        ))
+
+    # Independent files: write concurrently. Repeated paths keep the serial
+    # order so the last version of a page still wins.
+    files = [page.file for page in request.pages]
+    if len(files) > 1 and len(set(files)) == len(files):
+        with ThreadPoolExecutor(max_workers=min(WIKI_WRITE_WORKERS, len(files))) as ex:
+            outcomes = [(page, ex.submit(write, page)) for page in request.pages]
+            for page, future in outcomes:
+                try:
+                    future.result()
+                    created.append(page.file)
+                except Exception as e:
+                    failed.append({"file": page.file, "error": str(e)})
+    else:
+        for page in request.pages:
+            try:
+                write(page)
+                created.append(page.file)
+            except Exception as e:
+                failed.append({"file": page.file, "error": str(e)})
 
+    invalidate_wiki_paths()
     return {
         "success": len(failed) == 0,
         "created": created,
@@ -1137,8 +1223,7 @@ def get_current_employee(api: Any, whoami: Any) -> dev.EmployeeBrief:
     Returns:
         EmployeeBrief for the current employee
     """
-    resp = api.dispatch(dev.Req_GetEmployee(id=whoami.current_user))
-    emp = resp.employee
+    emp = get_employee_cached(api, whoami.current_user)
     return dev.EmployeeBrief(
         id=emp.id,
         name=emp.name,